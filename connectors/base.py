@@ -3,7 +3,7 @@ Classes de base pour tous les connecteurs.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 import logging
 from contextlib import contextmanager
 import os
@@ -20,6 +20,8 @@ logger = global_logger
 class BaseConnector(ABC):
     """Classe de base pour tous les connecteurs."""
     
+    __slots__ = ('config', 'connector_name', '_connected', 'metrics', 'logger', '__weakref__')
+    
     def __init__(self, config: Dict[str, Any], connector_name: Optional[str] = None):
         """
         Initialise le connecteur.
@@ -110,17 +112,10 @@ class BaseConnector(ABC):
             else:
                 return func
         
-        metric = self.metrics.start_operation(operation_name)
-        try:
+        with self.metrics.measure(operation_name):
             if callable(func):
-                result = func(*args, **kwargs)
-            else:
-                result = func
-            self.metrics.end_operation(metric, success=True)
-            return result
-        except Exception as e:
-            self.metrics.end_operation(metric, success=False, error_message=str(e))
-            raise
+                return func(*args, **kwargs)
+            return func
     
     @contextmanager
     def connection(self):
@@ -171,7 +166,7 @@ class BaseConnector(ABC):
         metrics = self.metrics.get_metrics()
         return {
             "connector_name": metrics.connector_name,
-            "total_operations": len(metrics.operations),
+            "total_operations": metrics.total_operations,
             "success_rate": metrics.success_rate,
             "average_duration": metrics.average_duration,
             "total_connections": metrics.connection_count,
@@ -201,6 +196,75 @@ class DatabaseConnector(BaseConnector):
     def fetch_all(self, query: str, params: Optional[Dict[str, Any]] = None):
         """Exécute une requête et retourne tous les résultats."""
         pass
+    
+    def execute_batch(self, statements: List[Tuple[str, Optional[Sequence[Any]]]]):
+        """
+        Exécute plusieurs requêtes à la suite et retourne le résultat de la dernière.
+        
+        Les connecteurs dont le pilote accepte plusieurs requêtes par appel
+        redéfinissent cette méthode pour tout envoyer en un seul aller-retour.
+        
+        Args:
+            statements: Liste de (requête, paramètres positionnels ou None)
+        
+        Returns:
+            Lignes de la dernière requête si elle en retourne, sinon son rowcount
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to database")
+        
+        def _execute_batch():
+            for query, params in statements:
+                self.cursor.execute(query, params)
+            if self.cursor.description is not None:
+                return self.cursor.fetchall()
+            return self.cursor.rowcount
+        
+        return self.execute_with_metrics("execute_batch", _execute_batch)
+    
+    # Nombre de lignes par requête d'insertion groupée
+    BULK_INSERT_BATCH_SIZE = 1000
+    
+    def insert_data_bulk(self, table_name: str, rows: List[Dict[str, Any]],
+                         batch_size: Optional[int] = None) -> int:
+        """
+        Insère plusieurs lignes avec une requête par lot au lieu d'une par ligne.
+        
+        Args:
+            table_name: Nom de la table
+            rows: Lignes à insérer, toutes avec les mêmes colonnes
+            batch_size: Nombre de lignes par lot (BULK_INSERT_BATCH_SIZE par défaut)
+        
+        Returns:
+            Nombre de lignes insérées
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to database")
+        if not rows:
+            return 0
+        
+        columns = list(rows[0].keys())
+        values = [tuple(row[column] for column in columns) for row in rows]
+        batch_size = batch_size or self.BULK_INSERT_BATCH_SIZE
+        
+        def _insert_bulk():
+            for start in range(0, len(values), batch_size):
+                self._insert_batch(table_name, columns, values[start:start + batch_size])
+            return len(values)
+        
+        return self.execute_with_metrics("insert_data_bulk", _insert_bulk)
+    
+    def _insert_batch(self, table_name: str, columns: List[str], values: List[tuple]):
+        """
+        Insère un lot de lignes (valeurs positionnelles, dans l'ordre de columns).
+        
+        L'implémentation par défaut passe par cursor.executemany, que
+        mysql-connector et snowflake-connector réécrivent en un seul INSERT
+        multi-lignes ; les autres connecteurs la redéfinissent.
+        """
+        placeholders = ", ".join(["%s"] * len(columns))
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        self.cursor.executemany(query, values)
 
 
 class FileSystemConnector(BaseConnector):
@@ -3,11 +3,14 @@ Configurations spécifiques pour les connecteurs de réseaux sociaux.
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from enum import Enum
 
 from .validator import ConnectorConfig
 
+# Longueur minimale des tokens et clés d'API, vérifiée par pydantic-core
+MIN_TOKEN_LENGTH = 10
+
 
 class SocialMediaVisibility(str, Enum):
     """Niveaux de visibilité pour les posts sur les réseaux sociaux."""
@@ -20,23 +23,21 @@ class SocialMediaVisibility(str, Enum):
 class TwitterConfig(ConnectorConfig):
     """Configuration pour le connecteur Twitter."""
 
-    bearer_token: str = Field(..., description="Token Bearer pour l'API Twitter")
+    bearer_token: str = Field(
+        ..., min_length=MIN_TOKEN_LENGTH, description="Token Bearer pour l'API Twitter"
+    )
     api_key: Optional[str] = Field(None, description="Clé API Twitter")
     api_secret: Optional[str] = Field(None, description="Secret API Twitter")
     access_token: Optional[str] = Field(None, description="Token d'accès Twitter")
     access_token_secret: Optional[str] = Field(None, description="Secret du token d'accès Twitter")
 
-    @validator("bearer_token")
-    def validate_bearer_token(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("Bearer token must be provided and valid")
-        return v
-
 
 class LinkedInConfig(ConnectorConfig):
     """Configuration pour le connecteur LinkedIn."""
 
-    access_token: str = Field(..., description="Token d'accès OAuth 2.0 LinkedIn")
+    access_token: str = Field(
+        ..., min_length=MIN_TOKEN_LENGTH, description="Token d'accès OAuth 2.0 LinkedIn"
+    )
     client_id: Optional[str] = Field(None, description="ID client de l'application LinkedIn")
     client_secret: Optional[str] = Field(
         None, description="Secret client de l'application LinkedIn"
@@ -45,46 +46,32 @@ class LinkedInConfig(ConnectorConfig):
         SocialMediaVisibility.PUBLIC, description="Visibilité par défaut des posts"
     )
 
-    @validator("access_token")
-    def validate_access_token(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("Access token must be provided and valid")
-        return v
-
 
 class FacebookConfig(ConnectorConfig):
     """Configuration pour le connecteur Facebook."""
 
-    access_token: str = Field(..., description="Token d'accès Facebook")
+    access_token: str = Field(
+        ..., min_length=MIN_TOKEN_LENGTH, description="Token d'accès Facebook"
+    )
     page_id: Optional[str] = Field(None, description="ID de la page Facebook (optionnel)")
     app_id: Optional[str] = Field(None, description="ID de l'application Facebook")
     app_secret: Optional[str] = Field(None, description="Secret de l'application Facebook")
 
-    @validator("access_token")
-    def validate_access_token(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("Access token must be provided and valid")
-        return v
-
 
 class InstagramConfig(ConnectorConfig):
     """Configuration pour le connecteur Instagram."""
 
-    access_token: str = Field(..., description="Token d'accès Instagram")
+    access_token: str = Field(
+        ..., min_length=MIN_TOKEN_LENGTH, description="Token d'accès Instagram"
+    )
     user_id: Optional[str] = Field(None, description="ID utilisateur Instagram")
     business_account: bool = Field(False, description="Compte business Instagram")
 
-    @validator("access_token")
-    def validate_access_token(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("Access token must be provided and valid")
-        return v
-
 
 class YouTubeConfig(ConnectorConfig):
     """Configuration pour le connecteur YouTube."""
 
-    api_key: str = Field(..., description="Clé API YouTube Data")
+    api_key: str = Field(..., min_length=MIN_TOKEN_LENGTH, description="Clé API YouTube Data")
     access_token: Optional[str] = Field(
         None, description="Token d'accès OAuth pour les opérations d'écriture"
     )
@@ -92,31 +79,21 @@ class YouTubeConfig(ConnectorConfig):
     client_secret: Optional[str] = Field(None, description="Secret client OAuth")
     channel_id: Optional[str] = Field(None, description="ID de la chaîne YouTube")
 
-    @validator("api_key")
-    def validate_api_key(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("API key must be provided and valid")
-        return v
-
 
 class TikTokConfig(ConnectorConfig):
     """Configuration pour le connecteur TikTok."""
 
-    access_token: str = Field(..., description="Token d'accès TikTok")
+    access_token: str = Field(..., min_length=MIN_TOKEN_LENGTH, description="Token d'accès TikTok")
     client_key: Optional[str] = Field(None, description="Clé client de l'application TikTok")
     client_secret: Optional[str] = Field(None, description="Secret client de l'application TikTok")
 
-    @validator("access_token")
-    def validate_access_token(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("Access token must be provided and valid")
-        return v
-
 
 class GitHubConfig(ConnectorConfig):
     """Configuration pour le connecteur GitHub."""
 
-    access_token: str = Field(..., description="Token d'accès personnel GitHub")
+    access_token: str = Field(
+        ..., min_length=MIN_TOKEN_LENGTH, description="Token d'accès personnel GitHub"
+    )
     default_owner: Optional[str] = Field(
         None, description="Propriétaire par défaut pour les opérations"
     )
@@ -124,12 +101,6 @@ class GitHubConfig(ConnectorConfig):
         None, description="Repository par défaut pour les opérations"
     )
 
-    @validator("access_token")
-    def validate_access_token(cls, v):
-        if not v or len(v) < 10:
-            raise ValueError("Access token must be provided and valid")
-        return v
-
 
 class SocialMediaConfig(BaseModel):
     """Configuration globale pour tous les réseaux sociaux."""
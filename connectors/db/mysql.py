@@ -3,7 +3,7 @@ Connecteur MySQL.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from contextlib import contextmanager
 
 try:
@@ -181,6 +181,41 @@ class MySQLConnector(DatabaseConnector):
         finally:
             self.connection.autocommit = old_autocommit
     
+    def execute_batch(self, statements: List[Tuple[str, Optional[Sequence[Any]]]]):
+        """
+        Exécute plusieurs requêtes en un seul aller-retour (multi-statements).
+        
+        Les requêtes utilisent des placeholders %s, leurs paramètres sont
+        concaténés dans l'ordre ; seul le résultat de la dernière est retourné.
+        Avec mysql-connector-python >= 9.2 (sans multi=True), les requêtes
+        sont exécutées l'une après l'autre.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to database")
+        
+        def _execute_batch():
+            script = "; ".join(query for query, _ in statements)
+            params = [value for _, values in statements for value in (values or ())]
+            try:
+                results = self.cursor.execute(script, params or None, multi=True)
+            except TypeError:
+                # Argument multi supprimé par le pilote : une requête par aller-retour
+                return _execute_each()
+            result = None
+            # Chaque résultat doit être consommé avant de passer au suivant
+            for statement in results:
+                result = statement.fetchall() if statement.with_rows else statement.rowcount
+            return result
+        
+        def _execute_each():
+            result = None
+            for query, values in statements:
+                self.cursor.execute(query, values or None)
+                result = self.cursor.fetchall() if self.cursor.with_rows else self.cursor.rowcount
+            return result
+        
+        return self.execute_with_metrics("execute_batch", _execute_batch)
+    
     def create_table(self, table_name: str, columns: Dict[str, str]):
         """Crée une table."""
         columns_def = ", ".join([f"{col} {col_type}" for col, col_type in columns.items()])
@@ -3,7 +3,7 @@ Connecteur PostgreSQL.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from contextlib import contextmanager
 
 try:
@@ -184,6 +184,33 @@ class PostgreSQLConnector(DatabaseConnector):
         query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
         return self.execute_query(query, data)
     
+    def execute_batch(self, statements: List[Tuple[str, Optional[Sequence[Any]]]]):
+        """
+        Exécute plusieurs requêtes en un seul aller-retour.
+        
+        Les paramètres sont liés côté client (comme le fait psycopg2 pour
+        toute requête) puis les requêtes sont envoyées ensemble ; seul le
+        résultat de la dernière est retourné.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to database")
+        
+        def _execute_batch():
+            script = b"; ".join(self.cursor.mogrify(query, params) for query, params in statements)
+            self.cursor.execute(script)
+            if self.cursor.description is not None:
+                return self.cursor.fetchall()
+            return self.cursor.rowcount
+        
+        return self.execute_with_metrics("execute_batch", _execute_batch)
+    
+    def _insert_batch(self, table_name: str, columns: List[str], values: List[tuple]):
+        """Insère un lot en une seule requête INSERT ... VALUES (...), (...)."""
+        from psycopg2.extras import execute_values
+        
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+        execute_values(self.cursor, query, values, page_size=len(values))
+    
     def get_table_info(self, table_name: str):
         """Retourne les informations d'une table."""
         query = """
@@ -3,7 +3,7 @@ Connecteur SQL Server.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from contextlib import contextmanager
 
 try:
@@ -235,6 +235,40 @@ class SQLServerConnector(DatabaseConnector):
         self.cursor.execute(query, param_values)
         return self.cursor.rowcount
     
+    def execute_batch(self, statements: List[Tuple[str, Optional[Sequence[Any]]]]):
+        """
+        Exécute plusieurs requêtes en un seul lot T-SQL (un aller-retour).
+        
+        Les requêtes utilisent des placeholders ?, leurs paramètres sont
+        concaténés dans l'ordre ; seul le résultat de la dernière est retourné.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to database")
+        
+        def _execute_batch():
+            script = ";\n".join(query for query, _ in statements)
+            params = [value for _, values in statements for value in (values or ())]
+            self.cursor.execute(script, params)
+            
+            # Un jeu de résultats par requête : on avance jusqu'au dernier
+            while True:
+                result = (
+                    self.cursor.fetchall() if self.cursor.description is not None
+                    else self.cursor.rowcount
+                )
+                if not self.cursor.nextset():
+                    return result
+        
+        return self.execute_with_metrics("execute_batch", _execute_batch)
+    
+    def _insert_batch(self, table_name: str, columns: List[str], values: List[tuple]):
+        """Insère un lot avec fast_executemany (paramètres envoyés en tableau)."""
+        columns_sql = ", ".join([f"[{col}]" for col in columns])
+        placeholders = ", ".join(["?" for _ in columns])
+        query = f"INSERT INTO [{table_name}] ({columns_sql}) VALUES ({placeholders})"
+        self.cursor.fast_executemany = True
+        self.cursor.executemany(query, values)
+    
     def get_table_info(self, table_name: str):
         """Retourne les informations d'une table."""
         query = """
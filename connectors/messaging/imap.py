@@ -11,11 +11,9 @@ from email.header import decode_header
 import logging
 import re
 import base64
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Union, Tuple
-
-# Import des utilitaires OAuth
-from .oauth_utils import OAuth2Manager
+from typing import Dict, Any, Iterator, Optional, List, Union, Tuple
 
 try:
     from connectors.base import MessagingConnector
@@ -55,6 +53,9 @@ class IMAPConfig(ConnectorConfig):
 class IMAPConnector(MessagingConnector):
     """Connecteur pour serveur IMAP."""
 
+    # Nombre maximum de messages demandés par commande FETCH
+    FETCH_BATCH_SIZE = 200
+
     def __init__(self, config: Dict[str, Any], connector_name: Optional[str] = None):
         super().__init__(config, connector_name)
 
@@ -68,7 +69,14 @@ class IMAPConnector(MessagingConnector):
 
     def connect(self):
         """Établit la connexion au serveur IMAP."""
+        executor = None
         try:
+            if self.imap_config.use_oauth and self.imap_config.oauth:
+                # Le token OAuth (éventuellement rafraîchi en HTTPS) est préparé
+                # pendant l'ouverture de la connexion IMAP
+                executor = ThreadPoolExecutor(max_workers=1)
+                pending_auth = executor.submit(self._oauth_auth_string)
+
             if self.imap_config.use_ssl:
                 self.imap_client = imaplib.IMAP4_SSL(
                     host=self.imap_config.host, port=self.imap_config.port
@@ -79,9 +87,9 @@ class IMAPConnector(MessagingConnector):
                 )
 
             # Authentification
-            if self.imap_config.use_oauth and self.imap_config.oauth:
+            if executor is not None:
                 # Utiliser OAuth 2.0
-                self._oauth_login()
+                self._oauth_login(pending_auth.result())
             elif self.imap_config.password:
                 # Utiliser l'authentification par mot de passe classique
                 self.imap_client.login(self.imap_config.username, self.imap_config.password)
@@ -98,23 +106,41 @@ class IMAPConnector(MessagingConnector):
         except Exception as e:
             self.logger.error(f"Failed to connect to IMAP server: {e}")
             raise ConnectionError(f"Failed to connect to IMAP server: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-    def _oauth_login(self):
-        """Authentification par OAuth 2.0."""
+    def _oauth_auth_string(self) -> str:
+        """
+        Génère la chaîne XOAUTH2, en rafraîchissant le token si nécessaire.
+
+        Returns:
+            Chaîne d'authentification XOAUTH2 encodée en base64
+        """
+        from .oauth_utils import OAuth2Manager
+
+        oauth_manager = OAuth2Manager(
+            client_id=self.imap_config.oauth.client_id,
+            client_secret=self.imap_config.oauth.client_secret,
+            refresh_token=self.imap_config.oauth.refresh_token,
+            access_token=self.imap_config.oauth.access_token,
+        )
+        return oauth_manager.get_auth_string(self.imap_config.username)
+
+    def _oauth_login(self, auth_string: Optional[str] = None):
+        """
+        Authentification par OAuth 2.0.
+
+        Args:
+            auth_string: Chaîne XOAUTH2 déjà générée (sinon générée ici)
+        """
         if not self.imap_config.oauth:
             raise ConfigurationError("OAuth configuration is missing")
 
         try:
-            # Créer le gestionnaire OAuth
-            oauth_manager = OAuth2Manager(
-                client_id=self.imap_config.oauth.client_id,
-                client_secret=self.imap_config.oauth.client_secret,
-                refresh_token=self.imap_config.oauth.refresh_token,
-                access_token=self.imap_config.oauth.access_token,
-            )
-
             # Générer le token XOAUTH2
-            auth_string = oauth_manager.get_auth_string(self.imap_config.username)
+            if auth_string is None:
+                auth_string = self._oauth_auth_string()
 
             # Le mécanisme d'authentification dépend du serveur
             if "gmail" in self.imap_config.host:
@@ -344,6 +370,110 @@ class IMAPConnector(MessagingConnector):
             "attachments": attachments,
         }
 
+    def _search_message_ids(
+        self, mailbox: str, limit: int, unread_only: bool, newest_first: bool
+    ) -> List[bytes]:
+        """
+        Sélectionne une boîte et retourne les IDs des messages à récupérer.
+
+        Args:
+            mailbox: Nom de la boîte à lire
+            limit: Nombre maximum d'IDs à retourner
+            unread_only: Si True, uniquement les messages non lus
+            newest_first: Si True, les messages les plus récents d'abord
+
+        Returns:
+            Liste des IDs d'emails (bytes)
+        """
+        self.select_mailbox(mailbox)
+
+        # Construction de la requête
+        search_criteria = "UNSEEN" if unread_only else "ALL"
+
+        # Exécution de la recherche
+        status, data = self.imap_client.search(None, search_criteria)
+        if status != "OK":
+            raise ConnectionError(f"Failed to search emails: {status}")
+
+        # Liste des IDs d'emails
+        email_ids = data[0].split()
+
+        # Si on veut les plus récents d'abord
+        if newest_first:
+            email_ids.reverse()
+
+        # Limiter le nombre de messages
+        return email_ids[:limit]
+
+    def iter_messages(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Itère sur les messages d'une boîte email.
+
+        Les messages sont récupérés par lots de FETCH_BATCH_SIZE (un seul
+        FETCH par lot) et parsés lot par lot, ce qui évite de garder toute la
+        liste en mémoire.
+
+        Args:
+            **kwargs: Mêmes options que receive_messages, plus :
+                - batch_size: Nombre de messages par FETCH
+
+        Yields:
+            Dictionnaire contenant les informations d'un message
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to IMAP server")
+
+        email_ids = self._search_message_ids(
+            mailbox=kwargs.get("mailbox", self.imap_config.mailbox),
+            limit=kwargs.get("limit", 10),
+            unread_only=kwargs.get("unread_only", False),
+            newest_first=kwargs.get("newest_first", True),
+        )
+
+        if not email_ids:
+            return
+
+        batch_size = kwargs.get("batch_size", self.FETCH_BATCH_SIZE)
+        batches = [email_ids[i : i + batch_size] for i in range(0, len(email_ids), batch_size)]
+
+        # Le FETCH du lot suivant est lancé pendant le parsing du lot courant,
+        # puis attendu avant de rendre la main : aucun FETCH n'est en cours
+        # quand l'appelant utilise la connexion entre deux messages.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._fetch_raw, batches[0])
+            for next_batch in batches[1:] + [None]:
+                raw_emails = pending.result()
+                if next_batch is not None:
+                    pending = executor.submit(self._fetch_raw, next_batch)
+                parsed = [self._parse_email(email_id, raw) for email_id, raw in raw_emails]
+                # Les erreurs éventuelles du FETCH remontent au tour suivant
+                wait([pending])
+                yield from parsed
+
+    def _fetch_raw(self, email_ids: List[bytes]) -> List[Tuple[str, bytes]]:
+        """
+        Récupère le contenu brut (RFC822) d'un lot d'emails en un seul FETCH.
+
+        Args:
+            email_ids: IDs des emails
+
+        Returns:
+            Liste de tuples (ID décodé, contenu brut), dans l'ordre de email_ids
+        """
+        status, data = self.imap_client.fetch(b",".join(email_ids), "(RFC822)")
+        if status != "OK":
+            return []
+
+        # Le serveur répond dans l'ordre de son choix : "<id> (RFC822 {taille}"
+        raw_by_id = {
+            part[0].split(None, 1)[0]: part[1] for part in data if isinstance(part, tuple)
+        }
+        return [
+            (email_id.decode(), raw_by_id[email_id])
+            for email_id in email_ids
+            if email_id in raw_by_id
+        ]
+
     def receive_messages(self, **kwargs) -> List[Dict[str, Any]]:
         """
         Reçoit les messages d'une boîte email.
@@ -361,49 +491,31 @@ class IMAPConnector(MessagingConnector):
         if not self._connected:
             raise ConnectionError("Not connected to IMAP server")
 
-        def _receive_messages():
-            mailbox = kwargs.get("mailbox", self.imap_config.mailbox)
-            limit = kwargs.get("limit", 10)
-            unread_only = kwargs.get("unread_only", False)
-            newest_first = kwargs.get("newest_first", True)
-
-            self.select_mailbox(mailbox)
-
-            # Construction de la requête
-            search_criteria = "UNSEEN" if unread_only else "ALL"
-
-            # Exécution de la recherche
-            status, data = self.imap_client.search(None, search_criteria)
-            if status != "OK":
-                raise ConnectionError(f"Failed to search emails: {status}")
-
-            # Liste des IDs d'emails
-            email_ids = data[0].split()
-            if not email_ids:
-                return []
-
-            # Si on veut les plus récents d'abord
-            if newest_first:
-                email_ids = reversed(email_ids)
-
-            # Limiter le nombre de messages
-            email_ids = list(email_ids)[:limit]
-
-            results = []
+        return self.execute_with_metrics(
+            "receive_messages", lambda: list(self.iter_messages(**kwargs))
+        )
 
-            # Récupération des messages
-            for email_id in email_ids:
-                status, data = self.imap_client.fetch(email_id, "(RFC822)")
-                if status == "OK":
-                    for response_part in data:
-                        if isinstance(response_part, tuple):
-                            email_data = response_part[1]
-                            email_info = self._parse_email(email_id.decode(), email_data)
-                            results.append(email_info)
+    @staticmethod
+    def _sequence_set(email_ids: List[Union[str, bytes]]) -> str:
+        """
+        Convertit une liste d'IDs en sequence-set IMAP (ex: "1,3,5:10").
 
-            return results
+        Args:
+            email_ids: Liste des IDs d'emails (str ou bytes)
 
-        return self.execute_with_metrics("receive_messages", _receive_messages)
+        Returns:
+            Sequence-set utilisable dans une seule commande IMAP
+        """
+        ids = sorted({int(email_id) for email_id in email_ids})
+        ranges = []
+        start = prev = ids[0]
+        for email_id in ids[1:]:
+            if email_id != prev + 1:
+                ranges.append(f"{start}:{prev}" if start != prev else str(start))
+                start = email_id
+            prev = email_id
+        ranges.append(f"{start}:{prev}" if start != prev else str(start))
+        return ",".join(ranges)
 
     def mark_as_read(self, email_ids: List[str], mailbox: str = None) -> bool:
         """
@@ -422,12 +534,9 @@ class IMAPConnector(MessagingConnector):
         def _mark_as_read():
             self.select_mailbox(mailbox)
 
-            for email_id in email_ids:
-                # Convertir en bytes si nécessaire
-                if isinstance(email_id, str):
-                    email_id = email_id.encode()
-
-                self.imap_client.store(email_id, "+FLAGS", "\\Seen")
+            # Un seul STORE pour tous les emails
+            if email_ids:
+                self.imap_client.store(self._sequence_set(email_ids), "+FLAGS", "\\Seen")
 
             return True
 
@@ -450,13 +559,9 @@ class IMAPConnector(MessagingConnector):
         def _delete_messages():
             self.select_mailbox(mailbox)
 
-            for email_id in email_ids:
-                # Convertir en bytes si nécessaire
-                if isinstance(email_id, str):
-                    email_id = email_id.encode()
-
-                # Marquer comme supprimé
-                self.imap_client.store(email_id, "+FLAGS", "\\Deleted")
+            # Marquer comme supprimés en un seul STORE
+            if email_ids:
+                self.imap_client.store(self._sequence_set(email_ids), "+FLAGS", "\\Deleted")
 
             # Appliquer les suppressions
             self.imap_client.expunge()
@@ -493,7 +598,7 @@ class GmailIMAPConnector(IMAPConnector):
 
             # Pour Gmail, le scope minimal est 'https://mail.google.com/'
             scopes = config.get("oauth_scopes", ["https://mail.google.com/"])
-            self.logger.info(f"OAuth configuration detected for Gmail with scopes: {scopes}")
+            logger.info(f"OAuth configuration detected for Gmail with scopes: {scopes}")
 
         super().__init__(gmail_config, connector_name or "gmail_imap")
 
@@ -6,6 +6,7 @@ import os
 import time
 import json
 import logging
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Tuple
 
 # Imports for OAuth
@@ -17,6 +18,17 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 logger = logging.getLogger(__name__)
 
 
+def _expiry_timestamp(credentials: Credentials) -> Optional[float]:
+    """Retourne l'expiration des credentials en timestamp Unix.
+
+    google-auth stocke l'expiration en datetime UTC naïf : la convertir avec
+    .timestamp() sans fuseau l'interpréterait en heure locale.
+    """
+    if not credentials.expiry:
+        return None
+    return credentials.expiry.replace(tzinfo=timezone.utc).timestamp()
+
+
 class OAuth2Manager:
     """
     Gestionnaire d'authentification OAuth 2.0.
@@ -58,6 +70,11 @@ class OAuth2Manager:
             with open(self.token_file, "r") as f:
                 token_info = json.load(f)
 
+            # Sans expiration connue, google-auth considère le token toujours valide
+            expiry = token_info.get("expiry")
+            if expiry is not None:
+                expiry = datetime.fromtimestamp(expiry, timezone.utc).replace(tzinfo=None)
+
             self.credentials = Credentials(
                 token=token_info.get("access_token"),
                 refresh_token=token_info.get("refresh_token"),
@@ -65,6 +82,7 @@ class OAuth2Manager:
                 client_id=self.client_id,
                 client_secret=self.client_secret,
                 scopes=self.scopes,
+                expiry=expiry,
             )
 
             if self.credentials and self.credentials.expired and self.credentials.refresh_token:
@@ -94,11 +112,16 @@ class OAuth2Manager:
                 "client_id": self.credentials.client_id,
                 "client_secret": self.credentials.client_secret,
                 "scopes": self.credentials.scopes,
-                "expiry": self.credentials.expiry.timestamp() if self.credentials.expiry else None,
+                "expiry": _expiry_timestamp(self.credentials),
             }
 
-            with open(self.token_file, "w") as f:
+            # Écriture atomique : un lecteur concurrent ne voit jamais un fichier partiel.
+            # Le fichier contient le client_secret : lisible par le seul propriétaire.
+            tmp_path = self.token_file + ".tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
                 json.dump(token_info, f)
+            os.replace(tmp_path, self.token_file)
 
             return True
         except Exception as e:
@@ -167,7 +190,7 @@ class OAuth2Manager:
         return {
             "access_token": self.credentials.token,
             "refresh_token": self.credentials.refresh_token,
-            "expiry": self.credentials.expiry.timestamp() if self.credentials.expiry else None,
+            "expiry": _expiry_timestamp(self.credentials),
         }
 
     def get_access_token(self) -> Tuple[str, int]:
@@ -227,9 +250,8 @@ class OAuth2Manager:
             # Mettre à jour les attributs
             self.access_token = self.credentials.token
             self.refresh_token = self.credentials.refresh_token
-            self.token_expiry = (
-                int(self.credentials.expiry.timestamp()) if self.credentials.expiry else None
-            )
+            expiry = _expiry_timestamp(self.credentials)
+            self.token_expiry = int(expiry) if expiry is not None else None
 
             # Sauvegarder si un fichier est spécifié
             if self.token_file:
@@ -8,6 +8,7 @@ permettant l'envoi d'emails avec ou sans pièces jointes.
 import os
 import smtplib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
@@ -49,7 +50,14 @@ class SMTPConnector(MessagingConnector):
 
     def connect(self):
         """Établit la connexion au serveur SMTP."""
+        executor = None
         try:
+            if self.smtp_config.use_oauth and self.smtp_config.oauth:
+                # Le token OAuth (éventuellement rafraîchi en HTTPS) est préparé
+                # pendant l'ouverture de la connexion SMTP
+                executor = ThreadPoolExecutor(max_workers=1)
+                pending_auth = executor.submit(self._oauth_auth_string)
+
             if self.smtp_config.use_ssl:
                 self.smtp_client = smtplib.SMTP_SSL(
                     host=self.smtp_config.host,
@@ -68,9 +76,9 @@ class SMTPConnector(MessagingConnector):
                     self.smtp_client.starttls()
 
             # Authentification
-            if self.smtp_config.use_oauth and self.smtp_config.oauth:
+            if executor is not None:
                 # Utiliser OAuth 2.0
-                self._oauth_login()
+                self._oauth_login(pending_auth.result())
             elif self.smtp_config.username and self.smtp_config.password:
                 # Authentification classique avec identifiant/mot de passe
                 self.smtp_client.login(self.smtp_config.username, self.smtp_config.password)
@@ -84,28 +92,44 @@ class SMTPConnector(MessagingConnector):
         except Exception as e:
             self.logger.error(f"Failed to connect to SMTP server: {e}")
             raise ConnectionError(f"Failed to connect to SMTP server: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-    def _oauth_login(self):
-        """Authentification par OAuth 2.0."""
+    def _oauth_auth_string(self) -> str:
+        """
+        Génère la chaîne XOAUTH2, en rafraîchissant le token si nécessaire.
+
+        Returns:
+            Chaîne d'authentification XOAUTH2 encodée en base64
+        """
+        from .oauth_utils import OAuth2Manager
+
+        oauth_manager = OAuth2Manager(
+            client_id=self.smtp_config.oauth.client_id,
+            client_secret=self.smtp_config.oauth.client_secret,
+            refresh_token=self.smtp_config.oauth.refresh_token,
+            access_token=self.smtp_config.oauth.access_token,
+        )
+        return oauth_manager.get_auth_string(self.smtp_config.username)
+
+    def _oauth_login(self, auth_string: Optional[str] = None):
+        """
+        Authentification par OAuth 2.0.
+
+        Args:
+            auth_string: Chaîne XOAUTH2 déjà générée (sinon générée ici)
+        """
         if not self.smtp_config.oauth:
             raise ConfigurationError("OAuth configuration is missing")
 
         try:
-            from .oauth_utils import OAuth2Manager
-
-            # Créer le gestionnaire OAuth
-            oauth_manager = OAuth2Manager(
-                client_id=self.smtp_config.oauth.client_id,
-                client_secret=self.smtp_config.oauth.client_secret,
-                refresh_token=self.smtp_config.oauth.refresh_token,
-                access_token=self.smtp_config.oauth.access_token,
-            )
+            if auth_string is None:
+                auth_string = self._oauth_auth_string()
 
             # Le mécanisme d'authentification dépend du serveur
             if "gmail" in self.smtp_config.host:
                 # Pour Gmail, on utilise XOAUTH2
-                auth_string = oauth_manager.get_auth_string(self.smtp_config.username)
-
                 # Authentification SMTP avec XOAUTH2
                 self.smtp_client.ehlo()
                 self.smtp_client.docmd("AUTH", f"XOAUTH2 {auth_string}")
@@ -115,7 +139,6 @@ class SMTPConnector(MessagingConnector):
                 self.logger.warning(
                     "OAuth authentication for this SMTP server is not specifically implemented"
                 )
-                auth_string = oauth_manager.get_auth_string(self.smtp_config.username)
                 self.smtp_client.ehlo()
                 self.smtp_client.docmd("AUTH", f"XOAUTH2 {auth_string}")
 
@@ -214,9 +237,18 @@ class SMTPConnector(MessagingConnector):
                     recipients.append(bcc)
 
             # Envoi du message
-            self.smtp_client.sendmail(
-                from_addr=self.smtp_config.username, to_addrs=recipients, msg=msg.as_string()
-            )
+            payload = msg.as_string()
+            try:
+                self.smtp_client.sendmail(
+                    from_addr=self.smtp_config.username, to_addrs=recipients, msg=payload
+                )
+            except smtplib.SMTPServerDisconnected:
+                # Session fermée par le serveur (inactivité) : reconnexion puis nouvel essai
+                self.logger.info("SMTP session closed by server, reconnecting")
+                self.connect()
+                self.smtp_client.sendmail(
+                    from_addr=self.smtp_config.username, to_addrs=recipients, msg=payload
+                )
 
             return {
                 "status": "sent",
@@ -2,7 +2,8 @@
 Registre pour l'enregistrement dynamique des connecteurs.
 """
 
-from typing import Dict, Type, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Any, Optional
 import logging
 
 from .base import BaseConnector
@@ -18,6 +19,8 @@ class ConnectorRegistry:
     def __init__(self):
         self._connectors: Dict[str, Type[BaseConnector]] = {}
         self._instances: Dict[str, BaseConnector] = {}
+        # Liste des connecteurs, recalculée après chaque (dés)enregistrement
+        self._listing: Optional[Mapping[str, str]] = None
     
     def register(self, name: str, connector_class: Type[BaseConnector]):
         """
@@ -31,12 +34,14 @@ class ConnectorRegistry:
             raise ConfigurationError(f"Connector class must inherit from BaseConnector: {connector_class}")
         
         self._connectors[name] = connector_class
+        self._listing = None
         logger.info(f"Registered connector: {name} -> {connector_class.__name__}")
     
     def unregister(self, name: str):
         """Désenregistre un connecteur."""
         if name in self._connectors:
             del self._connectors[name]
+            self._listing = None
             logger.info(f"Unregistered connector: {name}")
         
         # Supprime aussi l'instance si elle existe
@@ -59,11 +64,12 @@ class ConnectorRegistry:
         Raises:
             ConfigurationError: Si le connecteur n'est pas trouvé
         """
-        if name not in self._connectors:
+        connector_class = self._connectors.get(name)
+        if connector_class is None:
             available = list(self._connectors.keys())
             raise ConfigurationError(f"Connector '{name}' not found. Available: {available}")
         
-        return self._connectors[name]
+        return connector_class
     
     def create_connector(self, name: str, config: Dict[str, Any], 
                         instance_name: Optional[str] = None) -> BaseConnector:
@@ -107,9 +113,13 @@ class ConnectorRegistry:
         
         return self._instances[instance_name]
     
-    def list_connectors(self) -> Dict[str, str]:
-        """Retourne la liste des connecteurs enregistrés."""
-        return {name: cls.__name__ for name, cls in self._connectors.items()}
+    def list_connectors(self) -> Mapping[str, str]:
+        """Retourne la liste (en lecture seule) des connecteurs enregistrés."""
+        if self._listing is None:
+            self._listing = MappingProxyType(
+                {name: cls.__name__ for name, cls in self._connectors.items()}
+            )
+        return self._listing
     
     def list_instances(self) -> Dict[str, str]:
         """Retourne la liste des instances créées."""
@@ -160,6 +170,6 @@ def get_connector(instance_name: str) -> BaseConnector:
     return registry.get_instance(instance_name)
 
 
-def list_available_connectors() -> Dict[str, str]:
+def list_available_connectors() -> Mapping[str, str]:
     """Liste tous les connecteurs disponibles."""
     return registry.list_connectors()
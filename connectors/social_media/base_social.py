@@ -26,6 +26,8 @@ class SocialMediaConnector(BaseConnector):
     de réseau social doit implémenter.
     """
 
+    __slots__ = ('platform_name', 'session', 'authenticated', 'rate_limit_info')
+
     def __init__(self, config: Dict[str, Any], connector_name: Optional[str] = None):
         """
         Initialise le connecteur avec la configuration fournie.
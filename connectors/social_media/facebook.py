@@ -28,6 +28,8 @@ class FacebookConnector(SocialMediaConnector):
     Supporte la publication de posts, récupération du flux et gestion des pages.
     """
     
+    __slots__ = ('api_base_url', 'access_token', 'page_id')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le connecteur Facebook.
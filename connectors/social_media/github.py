@@ -7,7 +7,6 @@ et gérer les dépôts.
 """
 
 import requests
-import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import base64
@@ -31,6 +30,8 @@ class GitHubConnector(SocialMediaConnector):
     comme créer des issues, des commentaires, et gérer les repositories.
     """
 
+    __slots__ = ('api_base_url', 'access_token', 'default_owner', 'default_repo', 'headers')
+
     def __init__(self, config: Dict[str, Any], connector_name: Optional[str] = None):
         """
         Initialise le connecteur GitHub.
@@ -28,6 +28,8 @@ class InstagramConnector(SocialMediaConnector):
     Supporte la publication de photos et la récupération du contenu.
     """
     
+    __slots__ = ('api_base_url', 'access_token', 'user_id')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le connecteur Instagram.
@@ -29,6 +29,8 @@ class LinkedInConnector(SocialMediaConnector):
     récupération de flux et gestion de profil professionnel.
     """
     
+    __slots__ = ('api_base_url', 'access_token', 'client_id', 'client_secret')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le connecteur LinkedIn.
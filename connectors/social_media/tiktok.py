@@ -28,6 +28,8 @@ class TikTokConnector(SocialMediaConnector):
     Supporte la publication de vidéos et la récupération du contenu.
     """
     
+    __slots__ = ('api_base_url', 'access_token', 'client_key')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le connecteur TikTok.
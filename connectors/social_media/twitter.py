@@ -29,6 +29,10 @@ class TwitterConnector(SocialMediaConnector):
     comme publier des tweets, récupérer le flux et gérer le profil.
     """
     
+    __slots__ = (
+        'api_base_url', 'bearer_token', 'api_key', 'api_secret', 'access_token', 'access_token_secret'
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le connecteur Twitter.
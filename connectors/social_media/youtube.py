@@ -28,6 +28,8 @@ class YouTubeConnector(SocialMediaConnector):
     Supporte la gestion des vidéos, playlists et informations de chaîne.
     """
     
+    __slots__ = ('api_base_url', 'api_key', 'access_token')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialise le connecteur YouTube.
@@ -3,12 +3,20 @@ Utilitaires pour le module connectors.
 """
 
 from .retry import retry_on_exception, RetryManager
-from .metrics import MetricsCollector, OperationMetric, ConnectorMetrics
+from .metrics import (
+    MetricsCollector,
+    OperationMetric,
+    OperationLog,
+    ConnectorMetrics,
+    DurationHistogram,
+)
 
 __all__ = [
     'retry_on_exception',
     'RetryManager',
     'MetricsCollector',
     'OperationMetric',
-    'ConnectorMetrics'
+    'OperationLog',
+    'ConnectorMetrics',
+    'DurationHistogram'
 ]
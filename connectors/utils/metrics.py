@@ -2,24 +2,51 @@
 Collecteur de métriques pour les connecteurs.
 """
 
+import math
 import time
 import threading
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+import warnings
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+_SUMMARY_FMT = (
+    "Metrics Summary for %s:\n"
+    "- Total Operations: %d\n"
+    "- Success Rate: %.2f%%\n"
+    "- Average Duration: %.3fs\n"
+    "- Duration p50/p95/p99: %.3fs / %.3fs / %.3fs\n"
+    "- Total Connections: %d"
+)
+
+
 class OperationMetric:
     """Métrique pour une opération."""
-    operation_name: str
-    start_time: float
-    end_time: Optional[float] = None
-    success: bool = True
-    error_message: Optional[str] = None
+    
+    __slots__ = ('operation_name', 'start_time', 'end_time', 'success', 'error_message')
+    
+    def __init__(self, operation_name: str, start_time: float,
+                 end_time: Optional[float] = None, success: bool = True,
+                 error_message: Optional[str] = None):
+        self.operation_name = operation_name
+        self.start_time = start_time
+        self.end_time = end_time
+        self.success = success
+        self.error_message = error_message
+    
+    def __repr__(self) -> str:
+        return (
+            f"OperationMetric(operation_name={self.operation_name!r}, "
+            f"start_time={self.start_time!r}, end_time={self.end_time!r}, "
+            f"success={self.success!r}, error_message={self.error_message!r})"
+        )
     
     @property
     def duration(self) -> Optional[float]:
@@ -29,26 +56,210 @@ class OperationMetric:
         return None
 
 
-@dataclass
+class DurationHistogram:
+    """
+    Histogramme des durées d'opérations à buckets logarithmiques.
+
+    Les buckets couvrent de 1 µs à ~134 s avec 4 subdivisions par puissance
+    de 2 ; le premier et le dernier bucket absorbent les valeurs hors bornes.
+    Les compteurs sont additifs, ce qui permet de fusionner les histogrammes
+    de plusieurs collecteurs.
+    """
+
+    MIN_DURATION_NS = 1_000
+    SUBBUCKETS = 4
+    OCTAVES = 27
+    NUM_BUCKETS = SUBBUCKETS * OCTAVES + 2
+
+    __slots__ = ('counts', 'total')
+
+    def __init__(self):
+        self.counts = array('q', bytes(8 * self.NUM_BUCKETS))
+        self.total = 0
+
+    @classmethod
+    def bucket_index(cls, duration_ns: int) -> int:
+        """Index du bucket contenant une durée en nanosecondes."""
+        if duration_ns < cls.MIN_DURATION_NS:
+            return 0
+        index = int(math.log2(duration_ns / cls.MIN_DURATION_NS) * cls.SUBBUCKETS) + 1
+        return min(index, cls.NUM_BUCKETS - 1)
+
+    @classmethod
+    def bucket_bounds(cls, index: int) -> Tuple[float, float]:
+        """Bornes (en nanosecondes) d'un bucket."""
+        if index == 0:
+            return 0.0, float(cls.MIN_DURATION_NS)
+        lower = cls.MIN_DURATION_NS * 2 ** ((index - 1) / cls.SUBBUCKETS)
+        upper = cls.MIN_DURATION_NS * 2 ** (index / cls.SUBBUCKETS)
+        return lower, upper
+
+    def record(self, duration: float):
+        """Enregistre une durée exprimée en secondes."""
+        self.counts[self.bucket_index(int(duration * 1e9))] += 1
+        self.total += 1
+
+    def merge(self, other: "DurationHistogram"):
+        """Ajoute les compteurs d'un autre histogramme."""
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.total += other.total
+
+    def copy(self) -> "DurationHistogram":
+        """Retourne une copie indépendante de l'histogramme."""
+        clone = DurationHistogram()
+        clone.counts = array('q', self.counts)
+        clone.total = self.total
+        return clone
+
+    def percentile(self, q: float) -> float:
+        """
+        Estime le quantile q (entre 0 et 1) des durées, en secondes.
+
+        La valeur est interpolée linéairement à l'intérieur du bucket qui
+        contient le rang q * total.
+        """
+        return self.percentiles(q)[0]
+
+    def percentiles(self, *quantiles: float) -> Tuple[float, ...]:
+        """Estime plusieurs quantiles en un seul parcours des buckets."""
+        for q in quantiles:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError(f"Quantile must be between 0 and 1: {q}")
+
+        results = [0.0] * len(quantiles)
+        if self.total == 0:
+            return tuple(results)
+
+        pending = sorted(range(len(quantiles)), key=lambda i: quantiles[i])
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            while pending and cumulative + count >= quantiles[pending[0]] * self.total:
+                position = pending.pop(0)
+                lower, upper = self.bucket_bounds(index)
+                fraction = (quantiles[position] * self.total - cumulative) / count
+                results[position] = (lower + (upper - lower) * fraction) / 1e9
+            if not pending:
+                break
+            cumulative += count
+        return tuple(results)
+
+
+class OperationLog:
+    """
+    Journal d'opérations en copie-sur-écriture.
+
+    Les ajouts se font dans une queue modifiable ; snapshot() fige cette queue
+    en segment et retourne une vue qui partage les segments figés, sans
+    recopier les opérations déjà enregistrées.
+    """
+
+    MAX_SEGMENTS = 64
+
+    __slots__ = ('_segments', '_tail')
+
+    def __init__(self, operations: Optional[Iterable[OperationMetric]] = None):
+        self._segments: List[List[OperationMetric]] = []
+        self._tail: List[OperationMetric] = list(operations) if operations else []
+
+    def append(self, metric: OperationMetric):
+        """Ajoute une opération."""
+        self._tail.append(metric)
+
+    def snapshot(self) -> "OperationLog":
+        """Retourne une vue indépendante du journal."""
+        if self._tail:
+            self._segments.append(self._tail)
+            self._tail = []
+            # Compaction occasionnelle pour borner le nombre de segments
+            if len(self._segments) > self.MAX_SEGMENTS:
+                self._segments = [list(chain.from_iterable(self._segments))]
+        view = OperationLog()
+        view._segments = self._segments.copy()
+        return view
+
+    def __iter__(self) -> Iterator[OperationMetric]:
+        return chain(chain.from_iterable(self._segments), self._tail)
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments) + len(self._tail)
+
+    def __getitem__(self, index):
+        """Accès par index ou par tranche (qui retourne une liste), comme une liste."""
+        if isinstance(index, slice):
+            return list(self)[index]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("operation index out of range")
+        for segment in chain(self._segments, (self._tail,)):
+            if index < len(segment):
+                return segment[index]
+            index -= len(segment)
+
+    def __repr__(self) -> str:
+        return f"OperationLog({list(self)!r})"
+
+
 class ConnectorMetrics:
     """Métriques globales d'un connecteur."""
-    connector_name: str
-    operations: List[OperationMetric] = field(default_factory=list)
-    connection_count: int = 0
-    successful_operations: int = 0
-    failed_operations: int = 0
-    total_duration: float = 0.0
+    
+    __slots__ = (
+        'connector_name', 'operations', 'connection_count', 'successful_operations',
+        'failed_operations', 'completed_operations', 'total_duration', 'histogram'
+    )
+    
+    def __init__(self, connector_name: str,
+                 operations: Optional[Union[OperationLog, List[OperationMetric]]] = None,
+                 connection_count: int = 0, successful_operations: int = 0,
+                 failed_operations: int = 0, total_duration: float = 0.0,
+                 histogram: Optional[DurationHistogram] = None,
+                 completed_operations: int = 0):
+        self.connector_name = connector_name
+        if not isinstance(operations, OperationLog):
+            operations = OperationLog(operations)
+        self.operations = operations
+        self.connection_count = connection_count
+        self.successful_operations = successful_operations
+        self.failed_operations = failed_operations
+        self.completed_operations = completed_operations
+        self.total_duration = total_duration
+        self.histogram = histogram if histogram is not None else DurationHistogram()
     
     def add_operation(self, metric: OperationMetric):
         """Ajoute une métrique d'opération."""
         self.operations.append(metric)
-        if metric.success:
+        self.record(metric.duration, metric.success)
+    
+    def record(self, duration: Optional[float], success: bool = True):
+        """Comptabilise une opération sans conserver d'OperationMetric."""
+        if success:
             self.successful_operations += 1
         else:
             self.failed_operations += 1
         
-        if metric.duration is not None:
-            self.total_duration += metric.duration
+        if duration is not None:
+            self.completed_operations += 1
+            self.total_duration += duration
+            self.histogram.record(duration)
+    
+    def merge(self, other: "ConnectorMetrics"):
+        """Ajoute les compteurs et l'histogramme d'autres métriques."""
+        self.connection_count += other.connection_count
+        self.successful_operations += other.successful_operations
+        self.failed_operations += other.failed_operations
+        self.completed_operations += other.completed_operations
+        self.total_duration += other.total_duration
+        self.histogram.merge(other.histogram)
+    
+    @property
+    def total_operations(self) -> int:
+        """Nombre total d'opérations comptabilisées."""
+        return self.successful_operations + self.failed_operations
     
     @property
     def success_rate(self) -> float:
@@ -60,22 +271,105 @@ class ConnectorMetrics:
     
     @property
     def average_duration(self) -> float:
-        """Durée moyenne des opérations."""
-        if not self.operations:
-            return 0.0
-        completed_ops = [op for op in self.operations if op.duration is not None]
-        if not completed_ops:
+        """Durée moyenne des opérations terminées."""
+        if self.completed_operations == 0:
             return 0.0
-        return sum(op.duration for op in completed_ops) / len(completed_ops)
+        return self.total_duration / self.completed_operations
+
+
+class _ThreadShard:
+    """Métriques d'un thread et opérations en attente de fusion."""
+    
+    __slots__ = ('metrics', 'pending', 'flush_deadline', 'lock', 'owner')
+    
+    def __init__(self, connector_name: str):
+        self.metrics = ConnectorMetrics(connector_name)
+        # deque : append (écrivain) et popleft (lecteur) sont thread-safe
+        self.pending: deque = deque()
+        self.flush_deadline = 0
+        # Verrou jamais disputé par l'écrivain, sauf pendant une lecture
+        self.lock = threading.Lock()
+        self.owner = threading.current_thread()
 
 
 class MetricsCollector:
-    """Collecteur de métriques thread-safe."""
+    """
+    Collecteur de métriques thread-safe.
+    
+    Chaque thread écrit ses compteurs et son histogramme dans son propre
+    shard (un seul écrivain, verrou propre au shard) ; get_metrics()
+    additionne les shards. Les shards des threads terminés sont fusionnés
+    dans un agrégat puis retirés. Les opérations conservées sont fusionnées
+    dans le journal partagé par lots de FLUSH_BATCH_SIZE, ou au plus tard
+    après FLUSH_INTERVAL_NS, et à chaque lecture.
+    """
+    
+    FLUSH_BATCH_SIZE = 128
+    FLUSH_INTERVAL_NS = 1_000_000_000
     
     def __init__(self, connector_name: str):
         self.connector_name = connector_name
-        self.metrics = ConnectorMetrics(connector_name)
         self._lock = threading.Lock()
+        self._operations = OperationLog()
+        self._shards: List[_ThreadShard] = []
+        # Compteurs des threads terminés
+        self._retired = ConnectorMetrics(connector_name)
+        self._local = threading.local()
+    
+    def _shard(self) -> _ThreadShard:
+        """Retourne le shard du thread courant."""
+        local = self._local
+        shard = getattr(local, 'shard', None)
+        if shard is None:
+            shard = _ThreadShard(self.connector_name)
+            with self._lock:
+                self._retire_dead_shards()
+                self._shards.append(shard)
+            local.shard = shard
+        return shard
+    
+    def _retire_dead_shards(self):
+        """Fusionne puis retire les shards des threads terminés (verrou requis)."""
+        alive = []
+        for shard in self._shards:
+            if shard.owner.is_alive():
+                alive.append(shard)
+            else:
+                self._drain(shard)
+                self._retired.merge(shard.metrics)
+        self._shards = alive
+    
+    def _append_operation(self, shard: _ThreadShard, metric: OperationMetric):
+        """Met une opération en attente et fusionne le lot si nécessaire."""
+        shard.pending.append(metric)
+        now = time.monotonic_ns()
+        if len(shard.pending) >= self.FLUSH_BATCH_SIZE or now >= shard.flush_deadline:
+            with self._lock:
+                self._drain(shard)
+            shard.flush_deadline = now + self.FLUSH_INTERVAL_NS
+    
+    def _drain(self, shard: _ThreadShard):
+        """Transfère les opérations en attente d'un shard (verrou requis)."""
+        pending = shard.pending
+        operations = self._operations
+        while pending:
+            operations.append(pending.popleft())
+    
+    @property
+    def metrics(self) -> ConnectorMetrics:
+        """
+        Instantané des métriques agrégées (déprécié, utiliser get_metrics()).
+
+        Cet attribut était auparavant l'objet vivant ; depuis les shards par
+        thread, c'est une copie : la modifier n'a aucun effet sur le collecteur.
+        """
+        warnings.warn(
+            "MetricsCollector.metrics now returns a snapshot and is deprecated; use "
+            "get_metrics() to read, increment_connection_count()/measure() to record",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.get_metrics()
     
     def start_operation(self, operation_name: str) -> OperationMetric:
         """Démarre le suivi d'une opération."""
@@ -83,7 +377,7 @@ class MetricsCollector:
             operation_name=operation_name,
             start_time=time.time()
         )
-        logger.debug(f"Started operation: {operation_name}")
+        logger.debug("Started operation: %s", operation_name)
         return metric
     
     def end_operation(self, metric: OperationMetric, success: bool = True, 
@@ -93,42 +387,90 @@ class MetricsCollector:
         metric.success = success
         metric.error_message = error_message
         
-        with self._lock:
-            self.metrics.add_operation(metric)
+        shard = self._shard()
+        with shard.lock:
+            shard.metrics.record(metric.duration, success)
+        self._append_operation(shard, metric)
         
-        status = "SUCCESS" if success else "FAILED"
-        logger.debug(f"Ended operation: {metric.operation_name} - {status} - Duration: {metric.duration:.3f}s")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Ended operation: %s - %s - Duration: %.3fs", metric.operation_name,
+                         "SUCCESS" if success else "FAILED", metric.duration)
+    
+    @contextmanager
+    def measure(self, operation_name: str) -> Iterator[List]:
+        """
+        Mesure une opération sur la durée d'un bloc with.
+        
+        Le bloc reçoit une liste [success, error_message] modifiable pour
+        signaler un échec sans lever d'exception ; toute exception levée dans
+        le bloc (y compris KeyboardInterrupt) est comptée comme un échec puis
+        propagée. Seuls les échecs sont conservés dans la liste des
+        opérations.
+        
+        Usage:
+            with collector.measure("query") as outcome:
+                ...
+        """
+        outcome = [True, None]
+        start = time.monotonic_ns()
+        try:
+            yield outcome
+        except BaseException as e:
+            # KeyboardInterrupt, annulation... : l'opération n'a pas abouti
+            outcome[0] = False
+            outcome[1] = str(e)
+            raise
+        finally:
+            duration = (time.monotonic_ns() - start) / 1e9
+            success, error_message = outcome
+            shard = self._shard()
+            with shard.lock:
+                shard.metrics.record(duration, success)
+            if not success:
+                end_time = time.time()
+                self._append_operation(shard, OperationMetric(
+                    operation_name, end_time - duration, end_time, False, error_message
+                ))
     
     def increment_connection_count(self):
         """Incrémente le compteur de connexions."""
-        with self._lock:
-            self.metrics.connection_count += 1
+        shard = self._shard()
+        with shard.lock:
+            shard.metrics.connection_count += 1
     
     def get_metrics(self) -> ConnectorMetrics:
         """Retourne une copie des métriques actuelles."""
         with self._lock:
-            return ConnectorMetrics(
-                connector_name=self.metrics.connector_name,
-                operations=self.metrics.operations.copy(),
-                connection_count=self.metrics.connection_count,
-                successful_operations=self.metrics.successful_operations,
-                failed_operations=self.metrics.failed_operations,
-                total_duration=self.metrics.total_duration
+            self._retire_dead_shards()
+            for shard in self._shards:
+                self._drain(shard)
+            snapshot = ConnectorMetrics(
+                connector_name=self.connector_name,
+                operations=self._operations.snapshot()
             )
+            snapshot.merge(self._retired)
+            for shard in self._shards:
+                # Sous le verrou du shard : pas de compteurs à moitié mis à jour
+                with shard.lock:
+                    snapshot.merge(shard.metrics)
+        return snapshot
     
     def reset_metrics(self):
         """Remet à zéro toutes les métriques."""
         with self._lock:
-            self.metrics = ConnectorMetrics(self.connector_name)
+            self._operations = OperationLog()
+            self._shards = []
+            self._retired = ConnectorMetrics(self.connector_name)
+            # Les threads s'enregistrent à nouveau au prochain enregistrement
+            self._local = threading.local()
         logger.info(f"Metrics reset for connector: {self.connector_name}")
     
     def log_summary(self):
         """Log un résumé des métriques."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         metrics = self.get_metrics()
-        logger.info(f"""
-Metrics Summary for {self.connector_name}:
-- Total Operations: {len(metrics.operations)}
-- Success Rate: {metrics.success_rate:.2%}
-- Average Duration: {metrics.average_duration:.3f}s
-- Total Connections: {metrics.connection_count}
-        """.strip())
+        p50, p95, p99 = metrics.histogram.percentiles(0.50, 0.95, 0.99)
+        logger.info(_SUMMARY_FMT, self.connector_name, metrics.total_operations,
+                    metrics.success_rate * 100, metrics.average_duration,
+                    p50, p95, p99, metrics.connection_count)
@@ -12,6 +12,50 @@ from ..exceptions import RetryExhaustedError
 
 logger = logging.getLogger(__name__)
 
+# Générateur dédié au jitter, indépendant de l'état global du module random
+_rng = random.Random()
+
+
+def _retry_delays(max_attempts: int, backoff_factor: float, initial_delay: float,
+                  max_delay: float) -> Tuple[float, ...]:
+    """Calcul unique du backoff exponentiel pour chaque tentative."""
+    return tuple(
+        min(initial_delay * (backoff_factor ** attempt), max_delay)
+        for attempt in range(max_attempts - 1)
+    )
+
+
+def _call_with_retry(func: Callable, args: tuple, kwargs: dict, max_attempts: int,
+                     delays: Tuple[float, ...],
+                     exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]],
+                     jitter: bool):
+    """Appelle func en refaisant une tentative après chaque exception attendue."""
+    last_exception = None
+    
+    for attempt in range(max_attempts):
+        try:
+            return func(*args, **kwargs)
+        except exceptions as e:
+            last_exception = e
+            
+            if attempt == max_attempts - 1:
+                logger.error("Retry exhausted after %d attempts for %s: %s",
+                             max_attempts, getattr(func, '__name__', func), e)
+                raise RetryExhaustedError(f"Failed after {max_attempts} attempts: {e}") from e
+            
+            delay = delays[attempt]
+            
+            # Ajout de jitter pour éviter les pics de charge
+            if jitter:
+                delay += _rng.random() * (delay * 0.1)
+            
+            logger.warning("Attempt %d/%d failed for %s: %s. Retrying in %.2fs",
+                           attempt + 1, max_attempts, getattr(func, '__name__', func), e, delay)
+            time.sleep(delay)
+    
+    # Cette ligne ne devrait jamais être atteinte
+    raise last_exception
+
 
 def retry_on_exception(
     max_attempts: int = 3,
@@ -33,32 +77,11 @@ def retry_on_exception(
         jitter: Ajouter un délai aléatoire pour éviter les pics de charge
     """
     def decorator(func: Callable):
+        delays = _retry_delays(max_attempts, backoff_factor, initial_delay, max_delay)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_attempts - 1:
-                        logger.error(f"Retry exhausted after {max_attempts} attempts for {func.__name__}: {e}")
-                        raise RetryExhaustedError(f"Failed after {max_attempts} attempts: {e}") from e
-                    
-                    # Calcul du délai avec backoff exponentiel
-                    delay = min(initial_delay * (backoff_factor ** attempt), max_delay)
-                    
-                    # Ajout de jitter pour éviter les pics de charge
-                    if jitter:
-                        delay += random.uniform(0, delay * 0.1)
-                    
-                    logger.warning(f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. Retrying in {delay:.2f}s")
-                    time.sleep(delay)
-            
-            # Cette ligne ne devrait jamais être atteinte
-            raise last_exception
+            return _call_with_retry(func, args, kwargs, max_attempts, delays, exceptions, jitter)
         
         return wrapper
     return decorator
@@ -76,11 +99,9 @@ class RetryManager:
     
     def execute_with_retry(self, func: Callable, *args, **kwargs):
         """Exécute une fonction avec retry."""
-        decorated_func = retry_on_exception(
-            max_attempts=self.max_attempts,
-            backoff_factor=self.backoff_factor,
-            initial_delay=self.initial_delay,
-            max_delay=self.max_delay
-        )(func)
-        
-        return decorated_func(*args, **kwargs)
+        # Aucune fonction décorée n'est construite (ni conservée) : tout callable
+        # est accepté, et les délais suivent les attributs courants
+        delays = _retry_delays(self.max_attempts, self.backoff_factor,
+                               self.initial_delay, self.max_delay)
+        return _call_with_retry(func, args, kwargs, self.max_attempts, delays,
+                                Exception, True)
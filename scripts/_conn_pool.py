@@ -0,0 +1,149 @@
+"""
+Pool de connexions SMTP/IMAP et base de données partagé par les scripts d'exemple.
+
+Un seul connecteur est conservé par compte, identifié par
+(type, hôte, port, utilisateur, base, compte Snowflake), et réutilisé d'un
+envoi, d'une lecture ou d'une requête à l'autre. Une connexion restée
+inactive plus de IDLE_CHECK_SECONDS est vérifiée (NOOP pour SMTP/IMAP,
+test_connection() pour les bases) avant d'être rendue. Une connexion qui a servi MAX_USES
+fois est recyclée. Toutes les connexions sont fermées à la sortie du
+processus.
+
+Usage:
+    import _conn_pool
+    smtp = _conn_pool.get_smtp(config)
+    imap = _conn_pool.get_imap(config)
+    mysql = _conn_pool.get_db("mysql", config)
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from connectors import create_connector
+
+logger = logging.getLogger(__name__)
+
+# Nombre d'utilisations avant recyclage d'une connexion
+MAX_USES = 100
+
+# Au-delà de cette inactivité, la connexion est vérifiée par NOOP
+IDLE_CHECK_SECONDS = 30.0
+
+_lock = threading.Lock()
+
+# Clé -> [connecteur, nombre d'utilisations, dernier usage (time.monotonic)]
+_pool: Dict[Tuple[Any, ...], List[Any]] = {}
+
+
+def _key(connector_type: str, config: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        connector_type,
+        config.get("host"),
+        config.get("port"),
+        config.get("username"),
+        config.get("database"),
+        config.get("account"),
+    )
+
+
+def _is_alive(connector) -> bool:
+    """Vérifie que le serveur répond encore (NOOP ou requête de test)."""
+    if not connector._connected:
+        return False
+    client = getattr(connector, "smtp_client", None) or getattr(connector, "imap_client", None)
+    if client is None:
+        # Connecteurs de base de données : SELECT 1
+        return connector.test_connection()
+    try:
+        status = client.noop()[0]
+    except Exception:
+        return False
+    # smtplib retourne un code numérique, imaplib une chaîne
+    return status in (250, "OK")
+
+
+def _close(connector):
+    try:
+        connector.disconnect()
+    except Exception as e:
+        logger.warning("Error while closing pooled connection: %s", e)
+
+
+def _get(connector_type: str, config: Dict[str, Any]):
+    key = _key(connector_type, config)
+    with _lock:
+        entry = _pool.get(key)
+        if entry is not None:
+            connector, uses, last_used = entry
+            idle = time.monotonic() - last_used
+            if uses >= MAX_USES or (idle > IDLE_CHECK_SECONDS and not _is_alive(connector)):
+                # Connexion usée ou morte : on la remplace
+                del _pool[key]
+                _close(connector)
+                entry = None
+
+        if entry is None:
+            connector = create_connector(connector_type, config)
+            connector.connect()
+            entry = _pool[key] = [connector, 0, 0.0]
+
+        entry[1] += 1
+        entry[2] = time.monotonic()
+        return entry[0]
+
+
+def get_smtp(config: Dict[str, Any], connector_type: str = "gmail"):
+    """
+    Retourne un connecteur SMTP connecté pour ce compte.
+
+    Args:
+        config: Configuration du connecteur
+        connector_type: Type de connecteur enregistré
+
+    Returns:
+        Connecteur SMTP prêt à l'envoi
+    """
+    return _get(connector_type, config)
+
+
+def get_imap(config: Dict[str, Any], connector_type: str = "gmail_imap"):
+    """
+    Retourne un connecteur IMAP connecté pour ce compte.
+
+    Args:
+        config: Configuration du connecteur
+        connector_type: Type de connecteur enregistré
+
+    Returns:
+        Connecteur IMAP prêt à la lecture
+    """
+    return _get(connector_type, config)
+
+
+def get_db(connector_type: str, config: Dict[str, Any]):
+    """
+    Retourne un connecteur de base de données connecté.
+
+    Args:
+        connector_type: Type de connecteur enregistré (mysql, sqlserver, snowflake...)
+        config: Configuration du connecteur
+
+    Returns:
+        Connecteur prêt à exécuter des requêtes
+    """
+    return _get(connector_type, config)
+
+
+def close_all():
+    """Ferme toutes les connexions du pool."""
+    with _lock:
+        entries = list(_pool.values())
+        _pool.clear()
+    for connector, _, _ in entries:
+        _close(connector)
+
+
+atexit.register(close_all)
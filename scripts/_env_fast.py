@@ -0,0 +1,75 @@
+"""
+Chargement des variables d'environnement pour les scripts d'exemple.
+
+Le fichier .env est analysé une seule fois puis mis en cache dans .env.py
+sous forme de dictionnaire littéral. Tant que .env n'est pas modifié, les
+lancements suivants importent ce module, dont Python met le bytecode en
+cache, au lieu de ré-analyser .env ligne par ligne.
+
+Usage:
+    import _env_fast
+    env = _env_fast.load()
+"""
+
+import os
+import importlib.util
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENV_FILE = os.path.join(ROOT_DIR, ".env")
+CACHE_FILE = os.path.join(ROOT_DIR, ".env.py")
+
+
+def _read_cache() -> Dict[str, str]:
+    """Importe le dictionnaire ENV depuis .env.py."""
+    spec = importlib.util.spec_from_file_location("_env_cache", CACHE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ENV
+
+
+def _write_cache(values: Dict[str, str]):
+    """Écrit .env.py de façon atomique, lisible par le seul propriétaire."""
+    tmp_path = CACHE_FILE + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write("# Généré automatiquement depuis .env par scripts/_env_fast.py\n")
+        f.write(f"ENV = {values!r}\n")
+    os.replace(tmp_path, CACHE_FILE)
+
+
+def _parse_env_file() -> Dict[str, str]:
+    """Retourne les variables de .env, depuis le cache s'il est à jour."""
+    if not os.path.exists(ENV_FILE):
+        return {}
+
+    if os.path.exists(CACHE_FILE) and os.path.getmtime(CACHE_FILE) >= os.path.getmtime(ENV_FILE):
+        try:
+            return _read_cache()
+        except Exception:
+            pass  # Cache illisible : on le régénère
+
+    # python-dotenv n'est importé qu'en cas de cache absent ou périmé
+    from dotenv import dotenv_values
+
+    values = {key: value for key, value in dotenv_values(ENV_FILE).items() if value is not None}
+    try:
+        _write_cache(values)
+    except OSError:
+        pass  # Répertoire en lecture seule : pas de cache, pas grave
+    return values
+
+
+@lru_cache(maxsize=1)
+def load() -> Mapping[str, str]:
+    """
+    Charge .env dans os.environ (sans écraser les variables existantes).
+
+    Returns:
+        Vue en lecture seule de l'environnement après chargement
+    """
+    for key, value in _parse_env_file().items():
+        os.environ.setdefault(key, value)
+    return MappingProxyType(dict(os.environ))
@@ -2,7 +2,9 @@
 Exemple d'utilisation des configurations depuis le fichier INI.
 """
 
+import copy
 import logging
+from functools import lru_cache
 from connectors import create_connector
 from connectors.config.loader import load_config, config_loader
 
@@ -10,53 +12,61 @@ from connectors.config.loader import load_config, config_loader
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Une seule conversion de section INI par type de connecteur
+_load_cached_config = lru_cache(maxsize=None)(load_config)
+
+
+def _load_config(connector_type: str) -> dict:
+    """Retourne une copie de la configuration en cache (modifiable sans effet sur les suivantes)."""
+    return copy.deepcopy(_load_cached_config(connector_type))
+
 
 def test_all_configured_connectors():
     """Test tous les connecteurs configurés dans le fichier INI."""
     
     # Lister toutes les configurations disponibles
     available_configs = config_loader.get_section_names()
-    logger.info(f"Configurations disponibles: {available_configs}")
+    logger.info("Configurations disponibles: %s", available_configs)
     
     for connector_type in available_configs:
         try:
-            logger.info(f"\n--- Test de {connector_type.upper()} ---")
+            logger.info("\n--- Test de %s ---", connector_type.upper())
             
             # Charger la configuration
-            config = load_config(connector_type)
-            logger.info(f"Configuration chargée: {config}")
+            config = _load_config(connector_type)
+            logger.info("Configuration chargée: %s", config)
             
             # Créer le connecteur (ne pas se connecter pour éviter les erreurs de connexion)
             connector = create_connector(connector_type, config)
-            logger.info(f"✅ Connecteur {connector_type} créé avec succès")
+            logger.info("✅ Connecteur %s créé avec succès", connector_type)
             
         except Exception as e:
-            logger.error(f"❌ Erreur avec {connector_type}: {e}")
+            logger.error("❌ Erreur avec %s: %s", connector_type, e)
 
 
 def test_specific_connector(connector_type: str):
     """Test un connecteur spécifique."""
     try:
-        logger.info(f"\n--- Test spécifique de {connector_type.upper()} ---")
+        logger.info("\n--- Test spécifique de %s ---", connector_type.upper())
         
         # Vérifier si la configuration existe
         if not config_loader.has_section(connector_type):
-            logger.error(f"Configuration '{connector_type}' non trouvée")
+            logger.error("Configuration '%s' non trouvée", connector_type)
             return
         
         # Charger et afficher la configuration
-        config = load_config(connector_type)
-        logger.info(f"Configuration: {config}")
+        config = _load_config(connector_type)
+        logger.info("Configuration: %s", config)
         
         # Créer le connecteur
         connector = create_connector(connector_type, config)
-        logger.info(f"✅ Connecteur {connector_type} créé")
+        logger.info("✅ Connecteur %s créé", connector_type)
         
         # Test de base (sans connexion réelle)
-        logger.info(f"Connecté: {connector.is_connected}")
+        logger.info("Connecté: %s", connector.is_connected)
         
     except Exception as e:
-        logger.error(f"❌ Erreur: {e}")
+        logger.error("❌ Erreur: %s", e)
         import traceback
         traceback.print_exc()
 
@@ -66,24 +76,24 @@ def test_postgresql_with_connection():
     try:
         logger.info("\n--- Test PostgreSQL avec connexion ---")
         
-        config = load_config("postgresql")
+        config = _load_config("postgresql")
         postgres = create_connector("postgresql", config)
         
         # Tentative de connexion
         postgres.connect()
-        logger.info(f"✅ Connexion PostgreSQL établie: {postgres.is_connected}")
+        logger.info("✅ Connexion PostgreSQL établie: %s", postgres.is_connected)
         
         if postgres.is_connected and postgres.cursor:
             # Test simple
             postgres.cursor.execute("SELECT 1 as test, 'Hello from config!' as message")
             result = postgres.cursor.fetchone()
-            logger.info(f"Résultat de la requête: {result}")
+            logger.info("Résultat de la requête: %s", result)
         
         postgres.disconnect()
         logger.info("✅ Déconnexion PostgreSQL")
         
     except Exception as e:
-        logger.error(f"❌ Erreur PostgreSQL: {e}")
+        logger.error("❌ Erreur PostgreSQL: %s", e)
         import traceback
         traceback.print_exc()
 
@@ -11,11 +11,14 @@ Usage:
 
 import os
 import sys
+from pathlib import Path
 import logging
 from pprint import pprint
 
 # Ajout du répertoire parent au chemin de recherche
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from connectors import create_connector
 from connectors.exceptions.connector_exceptions import (
@@ -28,7 +31,7 @@ from connectors.exceptions.connector_exceptions import (
 def setup_logging():
     """Configure le logging."""
     logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        level=logging.INFO, format="{asctime} - {name} - {levelname} - {message}", style="{"
     )
 
 
@@ -168,8 +171,7 @@ def main():
                         delete_comment = input("Supprimer ce commentaire? (o/n): ")
 
                         if delete_comment.lower() == "o":
-                            comment_id = comment["url"].split("/")[-1]
-                            github.delete_post(f"comment:{owner}:{repo}:{comment_id}")
+                            github.delete_post(f"comment:{owner}:{repo}:{comment['id']}")
                             print("Commentaire supprimé!")
 
                     # 6. Demander si l'utilisateur veut fermer l'issue
@@ -9,14 +9,16 @@ Usage:
     python example_github_config.py
 """
 
-import os
 import sys
+from pathlib import Path
 import logging
-from dotenv import load_dotenv
 
 # Ajout du répertoire parent au chemin de recherche
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
+import _env_fast
 from connectors import create_connector
 from connectors.config.social_media import GitHubConfig, create_social_config_from_dict
 from connectors.exceptions.connector_exceptions import (
@@ -29,7 +31,7 @@ from connectors.exceptions.connector_exceptions import (
 def setup_logging():
     """Configure le logging."""
     logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        level=logging.INFO, format="{asctime} - {name} - {levelname} - {message}", style="{"
     )
 
 
@@ -38,10 +40,10 @@ def main():
     setup_logging()
 
     # Charger les variables d'environnement
-    load_dotenv()
+    env = _env_fast.load()
 
     # Récupération du token GitHub depuis l'environnement
-    github_token = os.environ.get("GITHUB_ACCESS_TOKEN")
+    github_token = env.get("GITHUB_ACCESS_TOKEN")
     if not github_token:
         print("Erreur: Variable d'environnement GITHUB_ACCESS_TOKEN non définie")
         print("Veuillez la définir avec votre token d'accès GitHub")
@@ -51,25 +53,25 @@ def main():
     try:
         github_config = GitHubConfig(
             access_token=github_token,
-            default_owner=os.environ.get("GITHUB_DEFAULT_OWNER"),
-            default_repo=os.environ.get("GITHUB_DEFAULT_REPO"),
+            default_owner=env.get("GITHUB_DEFAULT_OWNER"),
+            default_repo=env.get("GITHUB_DEFAULT_REPO"),
             metrics_enabled=True,
         )
 
+        # Sérialisation unique de la config, réutilisée ci-dessous
+        config = github_config.model_dump()
+
         # Création d'une config pour plusieurs réseaux sociaux
         # (si vous avez besoin de configurer plusieurs connecteurs)
         social_config = create_social_config_from_dict(
             {
-                "github": github_config.dict(),
+                "github": config,
                 # D'autres plateformes peuvent être ajoutées ici
             }
         )
 
         print(f"Plateformes configurées: {social_config.get_configured_platforms()}")
 
-        # Pour le connecteur, on utilise directement la config GitHub
-        config = github_config.dict()
-
     except ValueError as e:
         print(f"Erreur de configuration: {e}")
         return 1
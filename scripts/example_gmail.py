@@ -5,21 +5,26 @@ Exemple d'utilisation du connecteur Gmail.
 Ce script démontre comment utiliser le connecteur Gmail pour envoyer des emails.
 
 Usage:
-    python example_gmail.py
+    python example_gmail.py --to destinataire@example.com [--subject SUJET] [--html]
 """
 
-import os
 import sys
+import argparse
+from pathlib import Path
 import logging
-from dotenv import load_dotenv
 from datetime import datetime
 
 # Ajout du répertoire parent au chemin de recherche
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
+import _env_fast
 from connectors import create_connector
 from connectors.utils.logger import setup_logger
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 def setup_logging():
     """Configure le logging."""
@@ -32,18 +37,42 @@ def setup_logging():
     )
 
 
+def parse_args(env):
+    """Analyse les arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Envoi d'un email de test avec Gmail")
+    parser.add_argument(
+        "--to",
+        default=env.get("GMAIL_RECIPIENT"),
+        help="Adresse du destinataire (défaut: GMAIL_RECIPIENT)",
+    )
+    parser.add_argument(
+        "--subject",
+        default=env.get("GMAIL_SUBJECT", "Test du connecteur Gmail"),
+        help="Sujet de l'email (défaut: GMAIL_SUBJECT)",
+    )
+    parser.add_argument("--html", action="store_true", help="Envoyer le message en HTML")
+
+    args = parser.parse_args()
+    if not args.to:
+        parser.error("--to est requis (ou définissez GMAIL_RECIPIENT)")
+    return args
+
+
 def main():
     """Fonction principale."""
     logger = setup_logging()
 
     # Charger les variables d'environnement
-    load_dotenv()
+    env = _env_fast.load()
+
+    # Arguments collectés avant toute connexion
+    args = parse_args(env)
+    recipient, subject, html_mode = args.to, args.subject, args.html
 
     # Configuration Gmail
-    gmail_password = os.environ.get("GMAIL_PASSWORD")
-    gmail_username = os.environ.get("GMAIL_USERNAME")
+    credentials = env.get("GMAIL_USERNAME"), env.get("GMAIL_PASSWORD")
 
-    if not gmail_username or not gmail_password:
+    if not all(credentials):
         logger.error(
             "Les variables d'environnement GMAIL_USERNAME et GMAIL_PASSWORD doivent être définies"
         )
@@ -52,6 +81,7 @@ def main():
         logger.info("GMAIL_PASSWORD=votre_mot_de_passe_ou_mot_de_passe_d_application")
         return 1
 
+    gmail_username, gmail_password = credentials
     config = {
         "username": gmail_username,
         "password": gmail_password,
@@ -70,19 +100,15 @@ def main():
         if gmail.test_connection():
             logger.info("✅ Connexion à Gmail réussie")
 
-            # Préparation de l'email
-            recipient = input("Adresse email du destinataire: ").strip()
-            subject = input("Sujet de l'email: ").strip() or "Test du connecteur Gmail"
-            html_mode = input("Mode HTML? (o/n): ").strip().lower() == "o"
-
             # Corps du message
+            sent_at = datetime.now().strftime(TIMESTAMP_FORMAT)
             if html_mode:
                 message = f"""
                 <html>
                 <body>
                     <h1>Test du connecteur Gmail</h1>
                     <p>Ceci est un message de test envoyé depuis le connecteur Gmail.</p>
-                    <p>Date et heure: <strong>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</strong></p>
+                    <p>Date et heure: <strong>{sent_at}</strong></p>
                     <hr>
                     <p><em>Message généré automatiquement</em></p>
                 </body>
@@ -94,14 +120,14 @@ def main():
                 ======================
                 
                 Ceci est un message de test envoyé depuis le connecteur Gmail.
-                Date et heure: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                Date et heure: {sent_at}
                 
                 --
                 Message généré automatiquement
                 """
 
             # Envoi de l'email
-            logger.info(f"Envoi d'un email à {recipient}...")
+            logger.info("Envoi d'un email à %s...", recipient)
             with gmail.connection():
                 result = gmail.send_message(
                     message=message,
@@ -111,16 +137,16 @@ def main():
                     html=html_mode,
                 )
 
-                logger.info(f"✅ Email envoyé avec succès: {result}")
+                logger.info("✅ Email envoyé avec succès: %s", result)
 
                 # Afficher les métriques
                 metrics = gmail.get_metrics_summary()
-                logger.info(f"Métriques: {metrics}")
+                logger.info("Métriques: %s", metrics)
         else:
             logger.error("❌ Échec de la connexion à Gmail")
 
     except Exception as e:
-        logger.error(f"❌ Erreur: {e}")
+        logger.error("❌ Erreur: %s", e)
         import traceback
 
         logger.error(traceback.format_exc())
@@ -5,148 +5,101 @@ Example script for IMAP connector.
 This script demonstrates how to use the IMAP connector to list emails.
 """
 
-import os
 import sys
+from pathlib import Path
 import logging
-from dotenv import load_dotenv
-from tabulate import tabulate
-from datetime import datetime
+from collections import namedtuple
+from itertools import chain
 
 # Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import _env_fast
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=logging.INFO, format="{asctime} - {name} - {levelname} - {message}", style="{"
 )
 logger = logging.getLogger(__name__)
 
-# Import connectors
-try:
-    from connectors import get_connector, create_connector
-except ImportError as e:
-    logger.error(f"Failed to import connector: {e}")
-    sys.exit(1)
-
-# Load environment variables
-load_dotenv()
-
-
-def list_emails_with_imap():
-    """List emails using IMAP connector."""
-    # Configuration for general IMAP server
-    imap_config = {
-        "host": os.getenv("IMAP_HOST", "imap.example.com"),
-        "port": int(os.getenv("IMAP_PORT", "993")),
-        "username": os.getenv("IMAP_USERNAME", "user@example.com"),
-        "password": os.getenv("IMAP_PASSWORD", "password"),
-        "use_ssl": True,  # Default to SSL
-        "mailbox": "INBOX",  # Default mailbox to read from
-    }
 
+def _create_connector(connector_type, config):
+    """Import connectors on first use and create a connector instance."""
     try:
-        # Create connector instance
-        imap_connector = create_connector("imap", imap_config)
-
-        # Connect to IMAP server
-        imap_connector.connect()
-        logger.info("Connected to IMAP server.")
+        from connectors import create_connector
+    except ImportError as e:
+        logger.error("Failed to import connector: %s", e)
+        sys.exit(1)
+    return create_connector(connector_type, config)
 
-        # List available mailboxes
-        mailboxes = imap_connector.list_mailboxes()
-        logger.info(f"Available mailboxes: {', '.join(mailboxes)}")
 
-        # Select mailbox
-        mailbox = imap_config["mailbox"]
-        num_messages = imap_connector.select_mailbox(mailbox)
-        logger.info(f"Selected mailbox '{mailbox}' with {num_messages} messages")
+# Load environment variables
+_ENV = _env_fast.load()
 
-        # Get latest 10 messages
-        messages = imap_connector.receive_messages(
-            mailbox=mailbox, limit=10, newest_first=True, unread_only=False
-        )
 
-        if not messages:
-            logger.info(f"No messages found in '{mailbox}'")
-            return
+# One table row per message, as a tuple rather than a list
+Row = namedtuple("Row", "id date sender subject attachments")
 
-        # Display messages in a table
-        table_data = []
-        for msg in messages:
-            table_data.append(
-                [
-                    msg["id"],
-                    msg["date"],
-                    msg["from"],
-                    msg["subject"][:50] + ("..." if len(msg["subject"]) > 50 else ""),
-                    "✓" if msg["has_attachments"] else "",
-                ]
-            )
 
-        print(
-            tabulate(
-                table_data,
-                headers=["ID", "Date", "From", "Subject", "Attachments"],
-                tablefmt="pretty",
-            )
-        )
+def _trunc(s, n, _ell="..."):
+    """Truncate s to n characters, appending an ellipsis when cut."""
+    return s if len(s) <= n else s[:n] + _ell
 
-    except Exception as e:
-        logger.error(f"Error: {e}")
-    finally:
-        # Ensure we disconnect properly
-        if "imap_connector" in locals() and imap_connector._connected:
-            imap_connector.disconnect()
-            logger.info("Disconnected from IMAP server.")
 
+def _list_emails(connector_type, config, server_name, folders_method, show_first=False):
+    """
+    Connect, list folders and display the latest messages of INBOX.
 
-def list_emails_with_gmail():
-    """List emails using Gmail IMAP connector."""
-    # Configuration for Gmail IMAP server
-    gmail_config = {
-        "username": os.getenv("GMAIL_USERNAME", "user@gmail.com"),
-        "password": os.getenv("GMAIL_PASSWORD", "app_password"),
-        # No need to specify host/port as GmailIMAPConnector will set these
-    }
+    Args:
+        connector_type: Registered connector type ("imap" or "gmail_imap")
+        config: Connector configuration
+        server_name: Name used in log messages
+        folders_method: Name of the connector method listing folders/labels
+        show_first: Whether to print the content of the first email
+    """
+    from tabulate import tabulate
 
+    connector = None
     try:
         # Create connector instance
-        gmail_connector = create_connector("gmail_imap", gmail_config)
+        connector = _create_connector(connector_type, config)
 
-        # Connect to Gmail
-        gmail_connector.connect()
-        logger.info("Connected to Gmail IMAP.")
+        # Connect to the server
+        connector.connect()
+        logger.info("Connected to %s.", server_name)
 
-        # List available labels (in Gmail, labels are equivalent to folders/mailboxes)
-        labels = gmail_connector.get_all_labels()
-        logger.info(f"Available Gmail labels: {', '.join(labels)}")
+        # List available folders (in Gmail, labels are equivalent to folders/mailboxes)
+        folders = getattr(connector, folders_method)()
+        logger.info("Available folders: %s", ", ".join(folders))
 
-        # Select INBOX
-        mailbox = "INBOX"
-        num_messages = gmail_connector.select_mailbox(mailbox)
-        logger.info(f"Selected mailbox '{mailbox}' with {num_messages} messages")
+        # Select mailbox
+        mailbox = config.get("mailbox", "INBOX")
+        num_messages = connector.select_mailbox(mailbox)
+        logger.info("Selected mailbox '%s' with %s messages", mailbox, num_messages)
 
-        # Get latest 10 messages
-        messages = gmail_connector.receive_messages(
+        # Stream the latest 10 messages, one FETCH at a time
+        messages = connector.iter_messages(
             mailbox=mailbox, limit=10, newest_first=True, unread_only=False
         )
+        first_message = next(messages, None)
 
-        if not messages:
-            logger.info(f"No messages found in '{mailbox}'")
+        if first_message is None:
+            logger.info("No messages found in '%s'", mailbox)
             return
 
-        # Display messages in a table
-        table_data = []
-        for msg in messages:
-            table_data.append(
-                [
-                    msg["id"],
-                    msg["date"],
-                    msg["from"],
-                    msg["subject"][:50] + ("..." if len(msg["subject"]) > 50 else ""),
-                    "✓" if msg["has_attachments"] else "",
-                ]
+        # Display messages in a table, building rows as messages arrive
+        table_data = (
+            Row(
+                msg["id"],
+                msg["date"],
+                msg["from"],
+                _trunc(msg["subject"], 50),
+                "✓" if msg["has_attachments"] else "",
             )
+            for msg in chain((first_message,), messages)
+        )
 
         print(
             tabulate(
@@ -157,27 +110,47 @@ def list_emails_with_gmail():
         )
 
         # Optionally, display the content of the first email
-        if messages:
-            first_email = messages[0]
+        if show_first:
             print("\nContent of the first email:")
-            print(f"Subject: {first_email['subject']}")
-            print(f"From: {first_email['from']}")
-            print(f"To: {first_email['to']}")
-            print(f"Date: {first_email['date']}")
+            print(f"Subject: {first_message['subject']}")
+            print(f"From: {first_message['from']}")
+            print(f"To: {first_message['to']}")
+            print(f"Date: {first_message['date']}")
             print("\nBody:")
-            print(
-                first_email["body"] or first_email["html"][:500] + "..."
-                if len(first_email["html"]) > 500
-                else first_email["html"]
-            )
+            print(first_message["body"] or _trunc(first_message["html"], 500))
 
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
     finally:
         # Ensure we disconnect properly
-        if "gmail_connector" in locals() and gmail_connector._connected:
-            gmail_connector.disconnect()
-            logger.info("Disconnected from Gmail IMAP.")
+        if connector is not None and connector._connected:
+            connector.disconnect()
+            logger.info("Disconnected from %s.", server_name)
+
+
+def list_emails_with_imap():
+    """List emails using IMAP connector."""
+    # Configuration for general IMAP server
+    imap_config = {
+        "host": _ENV.get("IMAP_HOST", "imap.example.com"),
+        "port": int(_ENV.get("IMAP_PORT", "993")),
+        "username": _ENV.get("IMAP_USERNAME", "user@example.com"),
+        "password": _ENV.get("IMAP_PASSWORD", "password"),
+        "use_ssl": True,  # Default to SSL
+        "mailbox": "INBOX",  # Default mailbox to read from
+    }
+    _list_emails("imap", imap_config, "IMAP server", "list_mailboxes")
+
+
+def list_emails_with_gmail():
+    """List emails using Gmail IMAP connector."""
+    # Configuration for Gmail IMAP server
+    gmail_config = {
+        "username": _ENV.get("GMAIL_USERNAME", "user@gmail.com"),
+        "password": _ENV.get("GMAIL_PASSWORD", "app_password"),
+        # No need to specify host/port as GmailIMAPConnector will set these
+    }
+    _list_emails("gmail_imap", gmail_config, "Gmail IMAP", "get_all_labels", show_first=True)
 
 
 def main():
@@ -5,20 +5,25 @@ Example script for more advanced IMAP search operations.
 This script demonstrates how to filter emails with various criteria.
 """
 
-import os
 import sys
+from pathlib import Path
 import logging
 import argparse
-from dotenv import load_dotenv
+from collections import namedtuple
+from itertools import chain
 from tabulate import tabulate
 from datetime import datetime, timedelta
 
 # Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import _env_fast
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=logging.INFO, format="{asctime} - {name} - {levelname} - {message}", style="{"
 )
 logger = logging.getLogger(__name__)
 
@@ -26,11 +31,21 @@ logger = logging.getLogger(__name__)
 try:
     from connectors import create_connector
 except ImportError as e:
-    logger.error(f"Failed to import connector: {e}")
+    logger.error("Failed to import connector: %s", e)
     sys.exit(1)
 
+
 # Load environment variables
-load_dotenv()
+_ENV = _env_fast.load()
+
+
+# One table row per message, as a tuple rather than a list
+Row = namedtuple("Row", "id date sender subject attachments")
+
+
+def _trunc(s, n, _ell="..."):
+    """Truncate s to n characters, appending an ellipsis when cut."""
+    return s if len(s) <= n else s[:n] + _ell
 
 
 def search_emails(criteria=None, is_gmail=False):
@@ -47,18 +62,18 @@ def search_emails(criteria=None, is_gmail=False):
     if is_gmail:
         # Configuration for Gmail IMAP
         config = {
-            "username": os.getenv("GMAIL_USERNAME", "user@gmail.com"),
-            "password": os.getenv("GMAIL_PASSWORD", "app_password"),
+            "username": _ENV.get("GMAIL_USERNAME", "user@gmail.com"),
+            "password": _ENV.get("GMAIL_PASSWORD", "app_password"),
         }
         connector_name = "gmail_imap"
         logger.info("Using Gmail IMAP connector")
     else:
         # Configuration for general IMAP
         config = {
-            "host": os.getenv("IMAP_HOST", "imap.example.com"),
-            "port": int(os.getenv("IMAP_PORT", "993")),
-            "username": os.getenv("IMAP_USERNAME", "user@example.com"),
-            "password": os.getenv("IMAP_PASSWORD", "password"),
+            "host": _ENV.get("IMAP_HOST", "imap.example.com"),
+            "port": int(_ENV.get("IMAP_PORT", "993")),
+            "username": _ENV.get("IMAP_USERNAME", "user@example.com"),
+            "password": _ENV.get("IMAP_PASSWORD", "password"),
             "use_ssl": True,
         }
         connector_name = "imap"
@@ -73,36 +88,40 @@ def search_emails(criteria=None, is_gmail=False):
 
         # Connect to server
         imap_connector.connect()
-        logger.info(f"Connected to {connector_name}")
+        logger.info("Connected to %s", connector_name)
 
         # Select mailbox
         num_messages = imap_connector.select_mailbox(mailbox)
-        logger.info(f"Selected mailbox '{mailbox}' with {num_messages} messages")
+        logger.info("Selected mailbox '%s' with %s messages", mailbox, num_messages)
 
-        # Get messages with criteria
-        messages = imap_connector.receive_messages(
+        # Stream messages matching the criteria, one FETCH at a time
+        messages = imap_connector.iter_messages(
             mailbox=mailbox,
             limit=criteria.get("limit", 10),
             unread_only=criteria.get("unread_only", False),
             newest_first=criteria.get("newest_first", True),
         )
+        first_message = next(messages, None)
 
-        if not messages:
-            logger.info(f"No messages found matching your criteria")
+        if first_message is None:
+            logger.info("No messages found matching your criteria")
             return
 
-        # Display messages in a table
-        table_data = []
-        for msg in messages:
-            table_data.append(
-                [
+        # Display messages in a table, building rows as messages arrive
+        email_ids = []
+
+        def rows():
+            for msg in chain((first_message,), messages):
+                email_ids.append(msg["id"])
+                yield Row(
                     msg["id"],
                     msg["date"],
-                    msg["from"][:40] + ("..." if len(msg["from"]) > 40 else ""),
-                    msg["subject"][:30] + ("..." if len(msg["subject"]) > 30 else ""),
+                    _trunc(msg["from"], 40),
+                    _trunc(msg["subject"], 30),
                     "✓" if msg["has_attachments"] else "",
-                ]
-            )
+                )
+
+        table_data = rows()
 
         print(
             tabulate(
@@ -113,15 +132,14 @@ def search_emails(criteria=None, is_gmail=False):
         )
 
         # If we want to demonstrate how to mark emails as read
-        if criteria.get("mark_as_read", False) and messages:
-            # Get IDs of all fetched messages
-            email_ids = [msg["id"] for msg in messages]
-            logger.info(f"Marking {len(email_ids)} emails as read...")
+        if criteria.get("mark_as_read", False) and email_ids:
+            # IDs of all fetched messages were collected while rendering
+            logger.info("Marking %s emails as read...", len(email_ids))
             imap_connector.mark_as_read(email_ids, mailbox)
             logger.info("Emails marked as read")
 
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
     finally:
         # Ensure we disconnect properly
         if "imap_connector" in locals() and imap_connector._connected:
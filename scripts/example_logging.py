@@ -49,20 +49,20 @@ postgres_config = {
 def main():
     logger.info("Démarrage de l'exemple de logging")
     
-    try:
-        # Créer un connecteur (sachant que dans cet exemple, il ne pourra pas vraiment se connecter)
-        logger.debug("Création d'un connecteur PostgreSQL test")
-        
-        # La ligne ci-dessous échouerait en pratique car on n'a pas de serveur PostgreSQL réel
-        # mais c'est juste pour montrer comment les logs seraient gérés
-        # postgres = create_connector("postgresql", postgres_config, "demo_postgres")
-        
-        # Simuler une erreur
-        logger.warning("Simulation d'une erreur de connexion")
-        raise ConnectionError("Impossible de se connecter à la base de données")
-        
-    except Exception as e:
-        logger.error(f"Erreur lors de la connexion: {e}", exc_info=True)
+    # Créer un connecteur (sachant que dans cet exemple, il ne pourra pas vraiment se connecter)
+    logger.debug("Création d'un connecteur PostgreSQL test")
+
+    # La ligne ci-dessous échouerait en pratique car on n'a pas de serveur PostgreSQL réel
+    # mais c'est juste pour montrer comment les logs seraient gérés
+    # postgres = create_connector("postgresql", postgres_config, "demo_postgres")
+
+    # Simuler une erreur (sans lever d'exception : pas de traceback à formater)
+    logger.warning("Simulation d'une erreur de connexion")
+    logger.error(
+        "Erreur lors de la connexion: %s",
+        "Impossible de se connecter à la base de données",
+        extra={"simulated": True},
+    )
     
     logger.info("Fin de l'exemple de logging")
     
@@ -70,9 +70,10 @@ def main():
     log_path = os.path.abspath("logs")
     print(f"\nLes logs ont été écrits dans: {log_path}")
     print("Fichiers de logs:")
-    for file in sorted(os.listdir("logs")):
-        file_size = os.path.getsize(os.path.join("logs", file)) / 1024  # KB
-        print(f"  - {file} ({file_size:.1f} KB)")
+    with os.scandir("logs") as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            file_size = entry.stat().st_size / 1024  # KB
+            print(f"  - {entry.name} ({file_size:.1f} KB)")
 
 
 if __name__ == "__main__":
@@ -17,35 +17,48 @@ Prerequisites:
 
 import os
 import sys
+from pathlib import Path
+import atexit
 import logging
-import webbrowser
-from dotenv import load_dotenv
+import logging.handlers
 import json
-from datetime import datetime
+import time
 import argparse
-from tabulate import tabulate
+from itertools import chain
+from operator import itemgetter
 
 # Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-# Configure logging
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Configure logging; file records are written in batches of 200 (or at once on error)
+_log_file = logging.FileHandler("oauth_gmail.log")
+_log_file.setFormatter(logging.Formatter("{asctime} - {name} - {levelname} - {message}", style="{"))
+_file_handler = logging.handlers.MemoryHandler(
+    capacity=200, flushLevel=logging.ERROR, target=_log_file
+)
+atexit.register(_file_handler.flush)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(), logging.FileHandler("oauth_gmail.log")],
+    format="{asctime} - {name} - {levelname} - {message}",
+    style="{",
+    handlers=[logging.StreamHandler(), _file_handler],
 )
 logger = logging.getLogger(__name__)
 
 # Import connectors
 try:
-    from connectors import create_connector
+    import _conn_pool
+    import _env_fast
     from connectors.messaging.oauth_utils import OAuth2Manager, generate_gmail_oauth_config
 except ImportError as e:
-    logger.error(f"Failed to import connector: {e}")
+    logger.error("Failed to import connector: %s", e)
     sys.exit(1)
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (parsed .env is cached by _env_fast)
+_ENV = _env_fast.load()
+GMAIL_USERNAME = _ENV.get("GMAIL_USERNAME")
 
 # Constants
 TOKEN_FILE = os.path.expanduser("~/.gmail_oauth_token.json")
@@ -56,6 +69,43 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",
 ]
 
+# Refresh the cached access token when it expires within this many seconds
+TOKEN_REFRESH_MARGIN = 300
+
+
+# Characters kept in the truncated table cells (an ellipsis is appended when cut)
+DATE_LEN = 19
+TEXT_LEN = 40
+_ELLIPSIS = "..."
+
+
+def _trunc(s, n, _ell=_ELLIPSIS):
+    """Truncate s to n characters, appending an ellipsis when cut."""
+    return s if len(s) <= n else s[:n] + _ell
+
+
+def print_table(headers, rows, widths=None):
+    """
+    Print rows of strings as a plain left-aligned table.
+
+    Without widths, column widths are computed in one pass over the rows
+    (which are materialized). With widths, rows are printed as they are
+    consumed, so a generator is streamed line by line.
+    """
+    if widths is None:
+        rows = list(rows)
+        widths = [len(header) for header in headers]
+        for row in rows:
+            widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+    else:
+        widths = [max(width, len(header)) for width, header in zip(widths, headers)]
+
+    fmt = " | ".join("{:<%d}" % width for width in widths)
+    print(fmt.format(*headers))
+    print("-+-".join("-" * width for width in widths))
+    for row in rows:
+        print(fmt.format(*row))
+
 
 def setup_oauth_configuration():
     """
@@ -64,9 +114,9 @@ def setup_oauth_configuration():
     print("\n=== OAuth 2.0 Configuration for Gmail ===\n")
 
     # Get credentials from environment or user input
-    client_id = os.getenv("GOOGLE_CLIENT_ID") or input("Enter OAuth Client ID: ")
-    client_secret = os.getenv("GOOGLE_CLIENT_SECRET") or input("Enter OAuth Client Secret: ")
-    email = os.getenv("GMAIL_USERNAME") or input("Enter Gmail address: ")
+    client_id = _ENV.get("GOOGLE_CLIENT_ID") or input("Enter OAuth Client ID: ")
+    client_secret = _ENV.get("GOOGLE_CLIENT_SECRET") or input("Enter OAuth Client Secret: ")
+    email = GMAIL_USERNAME or input("Enter Gmail address: ")
 
     if not client_id or not client_secret or not email:
         logger.error("Client ID, Client Secret, and Gmail address are required")
@@ -82,7 +132,7 @@ def setup_oauth_configuration():
         if os.path.exists(TOKEN_FILE):
             oauth_manager._load_credentials_from_file()
             if oauth_manager.credentials and not oauth_manager.credentials.expired:
-                logger.info(f"Loaded valid credentials from {TOKEN_FILE}")
+                logger.info("Loaded valid credentials from %s", TOKEN_FILE)
                 return {
                     "client_id": client_id,
                     "client_secret": client_secret,
@@ -91,7 +141,7 @@ def setup_oauth_configuration():
                     "email": email,
                 }
     except Exception as e:
-        logger.warning(f"Error loading existing token: {e}")
+        logger.warning("Error loading existing token: %s", e)
 
     # If we don't have valid tokens, get new ones
     print("\nYou need to authorize this application to access your Gmail account.")
@@ -103,6 +153,8 @@ def setup_oauth_configuration():
 
     # Open browser automatically if possible
     try:
+        import webbrowser
+
         webbrowser.open(auth_url)
     except Exception:
         print("Please copy and paste the URL into your browser.")
@@ -114,7 +166,7 @@ def setup_oauth_configuration():
     tokens = oauth_manager.get_token_from_code(auth_code)
 
     # Save credentials
-    logger.info(f"Successfully obtained OAuth tokens")
+    logger.info("Successfully obtained OAuth tokens")
 
     return {
         "client_id": client_id,
@@ -125,131 +177,189 @@ def setup_oauth_configuration():
     }
 
 
-def send_email_with_oauth(oauth_config):
+def refresh_token_file(token_data):
     """
-    Send an email using Gmail with OAuth 2.0 authentication.
+    Refresh the access token stored in TOKEN_FILE.
+
+    The OAuth manager rewrites TOKEN_FILE atomically with the new access
+    token and its expiry.
+
+    Returns:
+        Updated token data (unchanged if the refresh failed)
     """
-    try:
-        # Create Gmail SMTP connector with OAuth
-        gmail_connector = create_connector(
-            "gmail",
-            {
-                "username": oauth_config["email"],
-                "use_oauth": True,
-                "oauth": {
-                    "client_id": oauth_config["client_id"],
-                    "client_secret": oauth_config["client_secret"],
-                    "refresh_token": oauth_config["refresh_token"],
-                    "access_token": oauth_config["access_token"],
-                },
-            },
-        )
+    oauth_manager = OAuth2Manager(
+        client_id=token_data.get("client_id"),
+        client_secret=token_data.get("client_secret"),
+        scopes=SCOPES,
+        token_file=TOKEN_FILE,
+    )
+    # Loading already refreshes a token that google-auth sees as expired
+    oauth_manager._load_credentials_from_file()
+    if oauth_manager.access_token is None and not oauth_manager.refresh_credentials():
+        logger.warning("Could not refresh the OAuth access token, using the cached one")
+        return token_data
+
+    logger.info("Refreshed OAuth access token")
+    return dict(
+        token_data,
+        access_token=oauth_manager.access_token,
+        expiry=oauth_manager.token_expiry,
+    )
+
 
-        # Connect to Gmail
-        gmail_connector.connect()
-        logger.info("Connected to Gmail SMTP using OAuth 2.0")
+def connector_config(oauth_config):
+    """
+    Build the Gmail connector configuration.
 
-        # Prepare email content
-        recipient = input("\nEnter recipient email address: ")
+    main() builds it once and hands the same dict to the SMTP and IMAP
+    connectors, so both authenticate with the same access token.
+    """
+    return {
+        "username": oauth_config["email"],
+        "use_oauth": True,
+        "oauth": {
+            "client_id": oauth_config["client_id"],
+            "client_secret": oauth_config["client_secret"],
+            "refresh_token": oauth_config["refresh_token"],
+            "access_token": oauth_config["access_token"],
+        },
+    }
+
+
+def prompt_emails():
+    """
+    Ask for the emails to send, until an empty recipient is entered.
+
+    Returns:
+        List of (recipient, subject, body, html) tuples
+    """
+    emails = []
+    while True:
+        recipient = input("\nEnter recipient email address (empty to finish): ").strip()
+        if not recipient:
+            return emails
         subject = input("Enter email subject: ")
         body = input("Enter email message (plain text): ")
+        emails.append((recipient, subject, body, None))
 
-        # Send email
-        gmail_connector.send_message(
-            body,
-            recipient,
-            subject=subject,
-            sender_name="OAuth Test",
-            html_content=f"<h2>{subject}</h2><p>{body}</p><p>Sent with OAuth 2.0 authentication!</p>",
-        )
 
-        logger.info(f"Email sent successfully to {recipient}")
+def load_emails_file(path):
+    """
+    Read the emails to send from a JSON Lines file.
+
+    Each non-empty line is an object with "to", "subject" and "body" keys,
+    and an optional "html" key. Lines are parsed as they are sent.
+
+    Yields:
+        (recipient, subject, body, html) tuples
+    """
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                email = json.loads(line)
+                yield email["to"], email.get("subject", ""), email["body"], email.get("html")
+            except (ValueError, KeyError) as e:
+                logger.error("Skipping invalid line %d of %s: %s", line_number, path, e)
+
+
+def send_email_with_oauth(config, emails):
+    """
+    Send emails using Gmail with OAuth 2.0 authentication.
+
+    All emails go through the pooled SMTP session of the account: TLS and
+    XOAUTH2 are negotiated once, not once per message.
+
+    Args:
+        config: Gmail connector configuration (see connector_config)
+        emails: Iterable of (recipient, subject, body, html) tuples; html
+            defaults to a small template around the body
+    """
+    try:
+        for recipient, subject, body, html in emails:
+            # Pooled Gmail SMTP connector, authenticated once per account
+            gmail_connector = _conn_pool.get_smtp(config)
+            gmail_connector.send_message(
+                body,
+                recipient,
+                subject=subject,
+                sender_name="OAuth Test",
+                html_content=html
+                or f"<h2>{subject}</h2><p>{body}</p><p>Sent with OAuth 2.0 authentication!</p>",
+            )
+            logger.info("Email sent successfully to %s", recipient)
 
     except Exception as e:
-        logger.error(f"Error sending email: {e}")
-    finally:
-        # Disconnect
-        if "gmail_connector" in locals() and gmail_connector._connected:
-            gmail_connector.disconnect()
-            logger.info("Disconnected from Gmail SMTP")
+        logger.error("Error sending email: %s", e)
 
 
-def read_emails_with_oauth(oauth_config):
+def read_emails_with_oauth(config):
     """
     Read emails using Gmail IMAP with OAuth 2.0 authentication.
+
+    Args:
+        config: Gmail connector configuration (see connector_config)
     """
     try:
-        # Create Gmail IMAP connector with OAuth
-        gmail_connector = create_connector(
-            "gmail_imap",
-            {
-                "username": oauth_config["email"],
-                "use_oauth": True,
-                "oauth": {
-                    "client_id": oauth_config["client_id"],
-                    "client_secret": oauth_config["client_secret"],
-                    "refresh_token": oauth_config["refresh_token"],
-                    "access_token": oauth_config["access_token"],
-                },
-            },
-        )
-
-        # Connect to Gmail
-        gmail_connector.connect()
+        # Pooled Gmail IMAP connector with OAuth
+        gmail_connector = _conn_pool.get_imap(config)
         logger.info("Connected to Gmail IMAP using OAuth 2.0")
 
         # List available labels (folders/mailboxes)
         labels = gmail_connector.get_all_labels()
-        logger.info(f"Available labels: {', '.join(labels[:10])}...")
+        logger.info("Available labels: %s...", ", ".join(labels[:10]))
 
         # Let user choose a label
         selected_label = input(f"\nEnter label to read from (default: INBOX): ") or "INBOX"
 
         # Select mailbox
         num_messages = gmail_connector.select_mailbox(selected_label)
-        logger.info(f"Selected '{selected_label}' with {num_messages} messages")
+        logger.info("Selected '%s' with %s messages", selected_label, num_messages)
 
         # Get email limit from user
         limit = int(input(f"\nHow many emails to display (default: 5): ") or "5")
 
-        # Read emails
-        messages = gmail_connector.receive_messages(
+        # Stream emails: each one is fetched and parsed only when its row is printed
+        messages = gmail_connector.iter_messages(
             mailbox=selected_label, limit=limit, newest_first=True, unread_only=False
         )
+        first_message = next(messages, None)
 
         # Display results
-        if not messages:
-            logger.info(f"No messages found in '{selected_label}'")
+        if first_message is None:
+            logger.info("No messages found in '%s'", selected_label)
             return
 
-        # Display emails in a table
-        table_data = []
-        for msg in messages:
-            table_data.append(
-                [
-                    msg["id"],
-                    msg["date"],
-                    msg["from"][:40] + ("..." if len(msg["from"]) > 40 else ""),
-                    msg["subject"][:40] + ("..." if len(msg["subject"]) > 40 else ""),
-                    "✓" if msg["has_attachments"] else "",
-                ]
+        # Display emails in a table; widths are known upfront since cells are truncated
+        # (IMAP sequence numbers never exceed the mailbox size)
+        fields = itemgetter("id", "date", "from", "subject", "has_attachments")
+        table_data = (
+            (
+                msg_id,
+                _trunc(date or "", DATE_LEN),
+                _trunc(sender, TEXT_LEN),
+                _trunc(subject, TEXT_LEN),
+                "✓" if has_attachments else "",
             )
-
-        print(
-            tabulate(
-                table_data,
-                headers=["ID", "Date", "From", "Subject", "Attachments"],
-                tablefmt="pretty",
+            for msg_id, date, sender, subject, has_attachments in map(
+                fields, chain((first_message,), messages)
             )
         )
+        print_table(
+            ("ID", "Date", "From", "Subject", "Attachments"),
+            table_data,
+            widths=(
+                len(str(num_messages)),
+                DATE_LEN + len(_ELLIPSIS),
+                TEXT_LEN + len(_ELLIPSIS),
+                TEXT_LEN + len(_ELLIPSIS),
+                1,
+            ),
+        )
 
     except Exception as e:
-        logger.error(f"Error reading emails: {e}")
-    finally:
-        # Disconnect
-        if "gmail_connector" in locals() and gmail_connector._connected:
-            gmail_connector.disconnect()
-            logger.info("Disconnected from Gmail IMAP")
+        logger.error("Error reading emails: %s", e)
 
 
 def main():
@@ -258,8 +368,15 @@ def main():
     parser.add_argument("--setup", action="store_true", help="Setup OAuth credentials")
     parser.add_argument("--send", action="store_true", help="Send an email using OAuth")
     parser.add_argument("--read", action="store_true", help="Read emails using OAuth")
+    parser.add_argument(
+        "--batch-file",
+        metavar="PATH",
+        help="Send the emails listed in a JSON Lines file (implies --send)",
+    )
 
     args = parser.parse_args()
+    if args.batch_file:
+        args.send = True
 
     # If no arguments, show help
     if not (args.setup or args.send or args.read):
@@ -268,6 +385,7 @@ def main():
         print("  --setup  Setup OAuth credentials")
         print("  --send   Send an email using OAuth")
         print("  --read   Read emails using OAuth")
+        print("  --batch-file PATH  Send the emails of a JSON Lines file")
         print("\nExample: python example_oauth_gmail.py --setup --send")
         return
 
@@ -278,28 +396,36 @@ def main():
     else:
         # Load existing configuration
         try:
-            with open(TOKEN_FILE, "r") as f:
-                token_data = json.load(f)
+            token_data = json.loads(Path(TOKEN_FILE).read_bytes())
+
+            # Refresh ahead of time rather than on the first SMTP/IMAP call
+            expiry = token_data.get("expiry")
+            if expiry is None or expiry <= time.time() + TOKEN_REFRESH_MARGIN:
+                token_data = refresh_token_file(token_data)
 
             oauth_config = {
                 "client_id": token_data.get("client_id"),
                 "client_secret": token_data.get("client_secret"),
                 "refresh_token": token_data.get("refresh_token"),
                 "access_token": token_data.get("access_token"),
-                "email": os.getenv("GMAIL_USERNAME") or input("Enter Gmail address: "),
+                "email": GMAIL_USERNAME or input("Enter Gmail address: "),
             }
-            logger.info(f"Loaded OAuth configuration from {TOKEN_FILE}")
+            logger.info("Loaded OAuth configuration from %s", TOKEN_FILE)
         except Exception as e:
-            logger.error(f"Error loading OAuth configuration: {e}")
+            logger.error("Error loading OAuth configuration: %s", e)
             oauth_config = setup_oauth_configuration()
 
+    # Shared by the SMTP and IMAP connectors
+    config = connector_config(oauth_config)
+
     # Send email if requested
     if args.send:
-        send_email_with_oauth(oauth_config)
+        emails = load_emails_file(args.batch_file) if args.batch_file else prompt_emails()
+        send_email_with_oauth(config, emails)
 
     # Read emails if requested
     if args.read:
-        read_emails_with_oauth(oauth_config)
+        read_emails_with_oauth(config)
 
 
 if __name__ == "__main__":
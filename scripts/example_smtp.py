@@ -8,15 +8,17 @@ Usage:
     python example_smtp.py
 """
 
-import os
 import sys
+from pathlib import Path
 import logging
-from dotenv import load_dotenv
 from datetime import datetime
 
 # Ajout du répertoire parent au chemin de recherche
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
+import _env_fast
 from connectors import create_connector
 
 
@@ -24,12 +26,12 @@ def main():
     """Fonction principale."""
     # Configuration du logging
     logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        level=logging.INFO, format="{asctime} - {name} - {levelname} - {message}", style="{"
     )
     logger = logging.getLogger(__name__)
 
     # Charger les variables d'environnement
-    load_dotenv()
+    _env_fast.load()
 
     print("=== Exemple du connecteur SMTP ===")
 
@@ -87,7 +89,7 @@ def main():
         #     print(f"Email HTML envoyé avec succès: {result}")
 
     except Exception as e:
-        logger.error(f"Erreur: {e}")
+        logger.error("Erreur: %s", e)
 
     print("\nPour utiliser Gmail, voir l'exemple dans example_gmail.py")
 
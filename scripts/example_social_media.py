@@ -8,7 +8,11 @@ Ce script démontre comment utiliser les différents connecteurs pour :
 - Obtenir les informations de profil
 """
 
+import io
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from connectors import create_connector, list_available_connectors
 
@@ -23,14 +27,54 @@ def main():
     for name, class_name in social_connectors.items():
         print(f"- {name}: {class_name}")
     
-    print("\n=== Exemple avec Twitter ===")
-    twitter_example()
+    examples = [
+        ("Twitter", twitter_example),
+        ("LinkedIn", linkedin_example),
+        ("Facebook", facebook_example),
+    ]
+    
+    # Les plateformes sont indépendantes : on les interroge en parallèle,
+    # chaque exemple écrit dans son propre tampon affiché dans l'ordre
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+            outputs = list(executor.map(lambda example: stdout.capture(*example), examples))
+    finally:
+        sys.stdout = stdout.stream
+    
+    sys.stdout.write("".join(outputs))
+
+
+class _ThreadBufferedStdout:
+    """Flux de sortie qui redirige print() vers un tampon propre au thread courant."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        return (getattr(self._local, "buffer", None) or self.stream).write(text)
     
-    print("\n=== Exemple avec LinkedIn ===")
-    linkedin_example()
+    def flush(self):
+        self.stream.flush()
     
-    print("\n=== Exemple avec Facebook ===")
-    facebook_example()
+    def capture(self, platform, example):
+        """Exécute un exemple et retourne tout ce qu'il a affiché."""
+        self._local.buffer = io.StringIO()
+        try:
+            print(f"\n=== Exemple avec {platform} ===")
+            example()
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def _gather(*calls):
+    """Exécute des appels API indépendants en parallèle et retourne leurs résultats dans l'ordre."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
 
 
 def twitter_example():
@@ -57,8 +101,11 @@ def twitter_example():
             if twitter.test_connection():
                 print("✅ Test de connexion réussi")
                 
-                # Récupération des informations du profil
-                profile = twitter.get_profile_info()
+                # Profil et flux sont indépendants : récupérés en parallèle
+                profile, feed = _gather(
+                    twitter.get_profile_info,
+                    lambda: twitter.get_feed(limit=5),
+                )
                 print(f"📱 Profil: @{profile.get('username', 'unknown')} "
                       f"({profile.get('followers_count', 0)} abonnés)")
                 
@@ -67,12 +114,12 @@ def twitter_example():
                 # tweet = twitter.post_message(message)
                 # print(f"📤 Tweet publié: {tweet.get('url', 'N/A')}")
                 
-                # Récupération du flux
-                feed = twitter.get_feed(limit=5)
                 print(f"📰 Récupéré {len(feed)} tweets du flux")
                 
-                for i, tweet in enumerate(feed[:3], 1):
-                    print(f"  {i}. {tweet.get('text', '')[:80]}...")
+                if feed:
+                    print("\n".join(
+                        f"  {i}. {tweet.get('text', '')[:80]}..." for i, tweet in enumerate(feed[:3], 1)
+                    ))
                 
                 # Informations sur les limites de taux
                 rate_info = twitter.get_rate_limit_info()
@@ -109,8 +156,12 @@ def linkedin_example():
         if linkedin.connect():
             print("✅ Connexion à LinkedIn réussie")
             
-            # Récupération des informations du profil
-            profile = linkedin.get_profile_info()
+            # Profil, flux et connexions sont indépendants : récupérés en parallèle
+            profile, feed, connections = _gather(
+                linkedin.get_profile_info,
+                lambda: linkedin.get_feed(limit=5),
+                lambda: linkedin.get_connections(limit=10),
+            )
             print(f"👔 Profil: {profile.get('name', 'unknown')} - {profile.get('headline', '')}")
             
             # Publication d'un post (exemple - ne pas exécuter en production)
@@ -119,12 +170,7 @@ def linkedin_example():
             # post = linkedin.post_message(message, options=options)
             # print(f"📤 Post LinkedIn publié: {post.get('url', 'N/A')}")
             
-            # Récupération du flux
-            feed = linkedin.get_feed(limit=5)
             print(f"📰 Récupéré {len(feed)} posts du flux")
-            
-            # Récupération des connexions
-            connections = linkedin.get_connections(limit=10)
             print(f"🤝 {len(connections)} connexions récupérées")
         
         else:
@@ -156,8 +202,11 @@ def facebook_example():
         if facebook.connect():
             print("✅ Connexion à Facebook réussie")
             
-            # Récupération des informations du profil
-            profile = facebook.get_profile_info()
+            # Profil et flux sont indépendants : récupérés en parallèle
+            profile, feed = _gather(
+                facebook.get_profile_info,
+                lambda: facebook.get_feed(limit=5),
+            )
             print(f"👤 Profil Facebook: {profile.get('name', 'unknown')}")
             
             # Publication d'un post (exemple - ne pas exécuter en production)
@@ -165,8 +214,6 @@ def facebook_example():
             # post = facebook.post_message(message)
             # print(f"📤 Post Facebook publié: {post.get('url', 'N/A')}")
             
-            # Récupération du flux
-            feed = facebook.get_feed(limit=5)
             print(f"📰 Récupéré {len(feed)} posts du flux")
         
         else:
@@ -199,8 +246,7 @@ def show_social_media_best_practices():
         "🚫 Ne jamais publier de contenu sensible ou non vérifié"
     ]
     
-    for practice in practices:
-        print(f"  {practice}")
+    print("\n".join(f"  {practice}" for practice in practices))
     
     print("\n=== 📚 Documentation API Officielle ===")
     docs = {
@@ -212,8 +258,7 @@ def show_social_media_best_practices():
         "TikTok": "https://developers.tiktok.com/"
     }
     
-    for platform, url in docs.items():
-        print(f"  {platform}: {url}")
+    print("\n".join(f"  {platform}: {url}" for platform, url in docs.items()))
 
 
 if __name__ == "__main__":
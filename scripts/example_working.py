@@ -13,36 +13,47 @@ sys.path.insert(0, parent_dir)
 
 import logging
 from connectors import create_connector, list_available_connectors
+from connectors.base import BaseConnector
+from connectors.registry import register_connector
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def exemple_base_connector():
-    """Exemple avec un connecteur mock."""
-    from connectors.base import BaseConnector
-    from connectors.registry import register_connector
+# Connecteurs de démonstration, enregistrés une seule fois à l'import
+@register_connector("mock")
+class MockConnector(BaseConnector):
+    """Connecteur mock pour démonstration."""
     
-    @register_connector("mock")
-    class MockConnector(BaseConnector):
-        """Connecteur mock pour démonstration."""
-        
-        def connect(self):
-            logger.info("Mock: Connexion établie")
-            self._connected = True
-        
-        def disconnect(self):
-            logger.info("Mock: Connexion fermée")
-            self._connected = False
-        
-        def test_connection(self) -> bool:
-            return self._connected
-        
-        def operation_example(self, data):
-            """Exemple d'opération avec métriques."""
-            return f"Processed: {data}"
+    def connect(self):
+        logger.info("Mock: Connexion établie")
+        self._connected = True
+    
+    def disconnect(self):
+        logger.info("Mock: Connexion fermée")
+        self._connected = False
     
+    def test_connection(self) -> bool:
+        return self._connected
+    
+    def operation_example(self, data):
+        """Exemple d'opération avec métriques."""
+        return f"Processed: {data}"
+
+
+@register_connector("config_test")
+class ConfigTestConnector(BaseConnector):
+    def connect(self):
+        self._connected = True
+    def disconnect(self):
+        self._connected = False
+    def test_connection(self) -> bool:
+        return True
+
+
+def exemple_base_connector():
+    """Exemple avec un connecteur mock."""
     # Configuration
     config = {
         "timeout": 30,
@@ -67,13 +78,13 @@ def exemple_base_connector():
                 "example_operation",
                 lambda: mock.operation_example("test data")
             )
-            logger.info(f"Operation result: {result}")
+            logger.info("Operation result: %s", result)
         else:
             logger.error("❌ Mock connection failed!")
     
     # Afficher les métriques
     metrics = mock.get_metrics_summary()
-    logger.info(f"Mock Metrics: {metrics}")
+    logger.info("Mock Metrics: %s", metrics)
 
 
 def exemple_postgresql_local():
@@ -107,16 +118,16 @@ def exemple_postgresql_local():
                 # Exemple simple de requête
                 result = postgres.fetch_one("SELECT version() as version")
                 if result:
-                    logger.info(f"PostgreSQL version: {result.get('version', 'Unknown')[:50]}...")
+                    logger.info("PostgreSQL version: %s...", result.get("version", "Unknown")[:50])
             else:
                 logger.error("❌ PostgreSQL connection test failed!")
         
         # Afficher les métriques
         metrics = postgres.get_metrics_summary()
-        logger.info(f"PostgreSQL Metrics: {metrics}")
+        logger.info("PostgreSQL Metrics: %s", metrics)
         
     except Exception as e:
-        logger.warning(f"PostgreSQL example skipped (no local DB?): {e}")
+        logger.warning("PostgreSQL example skipped (no local DB?): %s", e)
 
 
 def exemple_configurations():
@@ -143,33 +154,22 @@ def exemple_configurations():
     }
     
     logger.info("=== Configuration avec retry agressif ===")
-    from connectors.base import BaseConnector
-    from connectors.registry import register_connector
-    
-    @register_connector("config_test")
-    class ConfigTestConnector(BaseConnector):
-        def connect(self):
-            self._connected = True
-        def disconnect(self):
-            self._connected = False
-        def test_connection(self) -> bool:
-            return True
     
     # Test avec métriques
     test1 = create_connector("config_test", config_retry, "test_with_metrics")
     with test1.connection():
         result = test1.execute_with_metrics("test_op", lambda: "success")
-        logger.info(f"Result with metrics: {result}")
+        logger.info("Result with metrics: %s", result)
     
     # Test sans métriques
     test2 = create_connector("config_test", config_no_metrics, "test_no_metrics")
     with test2.connection():
         result = test2.execute_with_metrics("test_op", lambda: "success")
-        logger.info(f"Result without metrics: {result}")
+        logger.info("Result without metrics: %s", result)
     
     # Comparaison des métriques
-    logger.info(f"Metrics enabled: {test1.get_metrics_summary()}")
-    logger.info(f"Metrics disabled: {test2.get_metrics_summary()}")
+    logger.info("Metrics enabled: %s", test1.get_metrics_summary())
+    logger.info("Metrics disabled: %s", test2.get_metrics_summary())
 
 
 def main():
@@ -177,26 +177,26 @@ def main():
     
     # Lister les connecteurs disponibles
     connectors = list_available_connectors()
-    logger.info(f"Available connectors: {connectors}")
+    logger.info("Available connectors: %s", connectors)
     
     # Exemples fonctionnels
     logger.info("\n=== Mock Connector Example ===")
     try:
         exemple_base_connector()
     except Exception as e:
-        logger.error(f"Mock example failed: {e}")
+        logger.error("Mock example failed: %s", e)
     
     logger.info("\n=== Configuration Examples ===")
     try:
         exemple_configurations()
     except Exception as e:
-        logger.error(f"Configuration examples failed: {e}")
+        logger.error("Configuration examples failed: %s", e)
     
     logger.info("\n=== PostgreSQL Local Test (optional) ===")
     try:
         exemple_postgresql_local()
     except Exception as e:
-        logger.warning(f"PostgreSQL example skipped: {e}")
+        logger.warning("PostgreSQL example skipped: %s", e)
     
     logger.info("\n=== Module test completed! ===")
 
@@ -1,8 +1,15 @@
 """
 Exemples d'utilisation des nouveaux connecteurs de base de données.
+
+Les connexions sont prises dans le pool partagé des scripts (_conn_pool) :
+relancer un exemple réutilise la session déjà ouverte au lieu de refaire
+la poignée de main TCP/TLS et l'authentification.
 """
 
-from connectors import create_connector, list_available_connectors
+import sys
+
+import _conn_pool
+from connectors import list_available_connectors
 
 def example_mysql():
     """Exemple d'utilisation du connecteur MySQL."""
@@ -19,32 +26,23 @@ def example_mysql():
     }
     
     try:
-        # Créer le connecteur
-        mysql_conn = create_connector('mysql', config, 'mysql_instance')
-        
-        # Test de connexion
-        with mysql_conn.connection():
-            # Créer une table d'exemple
-            mysql_conn.create_table('users', {
-                'id': 'INT AUTO_INCREMENT PRIMARY KEY',
-                'name': 'VARCHAR(100)',
-                'email': 'VARCHAR(150)'
-            })
-            
-            # Insérer des données
-            mysql_conn.insert_data('users', {
-                'name': 'John Doe',
-                'email': 'john@example.com'
-            })
-            
-            # Récupérer des données
-            users = mysql_conn.fetch_all("SELECT * FROM users")
-            print(f"Users: {users}")
-            
-            # Informations sur la table
-            table_info = mysql_conn.get_table_info('users')
-            print(f"Table info: {table_info}")
-            
+        # Connecteur du pool partagé, connecté une seule fois par processus
+        mysql_conn = _conn_pool.get_db('mysql', config)
+        
+        # Créer la table, insérer des données et les relire en un seul aller-retour
+        users = mysql_conn.execute_batch([
+            ("CREATE TABLE IF NOT EXISTS users ("
+             "id INT AUTO_INCREMENT PRIMARY KEY, name VARCHAR(100), email VARCHAR(150))", None),
+            ("INSERT INTO users (name, email) VALUES (%s, %s), (%s, %s)",
+             ('John Doe', 'john@example.com', 'Jane Roe', 'jane@example.com')),
+            ("SELECT * FROM users", None),
+        ])
+        print(f"Users: {users}")
+        
+        # Informations sur la table
+        table_info = mysql_conn.get_table_info('users')
+        print(f"Table info: {table_info}")
+        
         print("MySQL example completed successfully!")
         
     except Exception as e:
@@ -66,32 +64,23 @@ def example_sqlserver():
     }
     
     try:
-        # Créer le connecteur
-        sql_conn = create_connector('sqlserver', config, 'sqlserver_instance')
-        
-        # Test de connexion
-        with sql_conn.connection():
-            # Créer une table d'exemple
-            sql_conn.create_table('products', {
-                'id': 'INT IDENTITY(1,1) PRIMARY KEY',
-                'name': 'NVARCHAR(100)',
-                'price': 'DECIMAL(10,2)'
-            })
-            
-            # Insérer des données
-            sql_conn.insert_data('products', {
-                'name': 'Product A',
-                'price': 19.99
-            })
-            
-            # Récupérer des données
-            products = sql_conn.fetch_all("SELECT * FROM products")
-            print(f"Products: {products}")
-            
-            # Informations sur la table
-            table_info = sql_conn.get_table_info('products')
-            print(f"Table info: {table_info}")
-            
+        # Connecteur du pool partagé, connecté une seule fois par processus
+        sql_conn = _conn_pool.get_db('sqlserver', config)
+        
+        # Créer la table, insérer des données et les relire en un seul lot T-SQL
+        products = sql_conn.execute_batch([
+            ("IF OBJECT_ID('products', 'U') IS NULL CREATE TABLE products ("
+             "id INT IDENTITY(1,1) PRIMARY KEY, name NVARCHAR(100), price DECIMAL(10,2))", None),
+            ("INSERT INTO products (name, price) VALUES (?, ?), (?, ?)",
+             ('Product A', 19.99, 'Product B', 24.50)),
+            ("SELECT * FROM products", None),
+        ])
+        print(f"Products: {products}")
+        
+        # Informations sur la table
+        table_info = sql_conn.get_table_info('products')
+        print(f"Table info: {table_info}")
+        
         print("SQL Server example completed successfully!")
         
     except Exception as e:
@@ -114,39 +103,37 @@ def example_snowflake():
     }
     
     try:
-        # Créer le connecteur
-        snow_conn = create_connector('snowflake', config, 'snowflake_instance')
-        
-        # Test de connexion
-        with snow_conn.connection():
-            # Créer une table d'exemple
-            snow_conn.create_table('customers', {
-                'id': 'INTEGER AUTOINCREMENT',
-                'name': 'VARCHAR(100)',
-                'region': 'VARCHAR(50)',
-                'created_at': 'TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()'
-            })
-            
-            # Insérer des données
-            snow_conn.insert_data('customers', {
-                'name': 'Customer A',
-                'region': 'North America'
-            })
-            
-            # Récupérer des données
-            customers = snow_conn.fetch_all("SELECT * FROM customers")
-            print(f"Customers: {customers}")
-            
-            # Fonctionnalités spécifiques à Snowflake
-            warehouses = snow_conn.get_warehouses()
-            print(f"Available warehouses: {warehouses}")
-            
-            databases = snow_conn.get_databases()
-            print(f"Available databases: {databases}")
-            
-            schemas = snow_conn.get_schemas()
-            print(f"Available schemas: {schemas}")
-            
+        # Connecteur du pool partagé, connecté une seule fois par processus
+        snow_conn = _conn_pool.get_db('snowflake', config)
+        
+        # Créer une table d'exemple
+        snow_conn.create_table('customers', {
+            'id': 'INTEGER AUTOINCREMENT',
+            'name': 'VARCHAR(100)',
+            'region': 'VARCHAR(50)',
+            'created_at': 'TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()'
+        })
+        
+        # Insérer des données (une requête par lot, pas une par ligne)
+        snow_conn.insert_data_bulk('customers', [
+            {'name': 'Customer A', 'region': 'North America'},
+            {'name': 'Customer B', 'region': 'Europe'},
+        ])
+        
+        # Récupérer des données
+        customers = snow_conn.fetch_all("SELECT * FROM customers")
+        print(f"Customers: {customers}")
+        
+        # Fonctionnalités spécifiques à Snowflake
+        warehouses = snow_conn.get_warehouses()
+        print(f"Available warehouses: {warehouses}")
+        
+        databases = snow_conn.get_databases()
+        print(f"Available databases: {databases}")
+        
+        schemas = snow_conn.get_schemas()
+        print(f"Available schemas: {schemas}")
+        
         print("Snowflake example completed successfully!")
         
     except Exception as e:
@@ -162,6 +149,9 @@ def show_available_connectors():
 
 
 if __name__ == "__main__":
+    # Sortie par blocs même sur un terminal : un write() par bloc, pas par print()
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("Exemples d'utilisation des connecteurs de base de données")
     print("=" * 60)
     
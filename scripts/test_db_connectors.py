@@ -2,6 +2,12 @@
 Test de l'enregistrement des connecteurs de base de données.
 """
 
+import sys
+
+# Connecteurs de base de données attendus, dans l'ordre d'affichage
+EXPECTED_CONNECTORS = ('postgresql', 'mysql', 'sqlserver', 'snowflake')
+
+
 def test_connector_registration():
     """Teste que tous les connecteurs sont correctement enregistrés."""
     print("Test d'enregistrement des connecteurs de base de données")
@@ -14,9 +20,7 @@ def test_connector_registration():
         connectors = list_available_connectors()
         print(f"Connecteurs enregistrés: {len(connectors)}")
         
-        expected_connectors = ['postgresql', 'mysql', 'sqlserver', 'snowflake']
-        
-        for connector_name in expected_connectors:
+        for connector_name in EXPECTED_CONNECTORS:
             if connector_name in connectors:
                 print(f"✓ {connector_name}: {connectors[connector_name]}")
             else:
@@ -25,7 +29,7 @@ def test_connector_registration():
         # Test de création (sans connexion)
         print("\nTest de création des connecteurs:")
         
-        for connector_name in expected_connectors:
+        for connector_name in EXPECTED_CONNECTORS:
             if connector_name in connectors:
                 try:
                     # Configuration minimale pour test
@@ -65,5 +69,7 @@ def test_connector_registration():
 
 
 if __name__ == "__main__":
+    # Sortie par blocs même sur un terminal : un write() par bloc, pas par print()
+    sys.stdout.reconfigure(line_buffering=False)
     success = test_connector_registration()
     exit(0 if success else 1)
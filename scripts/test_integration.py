@@ -6,14 +6,37 @@ Ce script vérifie que tous les connecteurs peuvent être importés et instanci
 correctement, sans nécessiter de vrais tokens d'API.
 """
 
+import argparse
+import io
 import sys
 import os
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
 # Ajouter le chemin du module au PYTHONPATH
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+def _print_exc():
+    """
+    Affiche l'exception en cours sur stderr, en un seul write().
+    
+    La trace complète n'est formatée que si VERBOSE_TRACE est défini ;
+    sinon une ligne suffit, le message d'erreur étant déjà affiché.
+    """
+    if os.environ.get("VERBOSE_TRACE"):
+        sys.stderr.write(traceback.format_exc())
+    else:
+        exc = sys.exc_info()[1]
+        sys.stderr.write(f"{type(exc).__name__}: {exc} (VERBOSE_TRACE=1 pour la trace complète)\n")
+
+
+# Connecteurs sociaux attendus (tuple pour l'ordre d'affichage, frozenset pour les tests)
+SOCIAL_CONNECTORS = ('twitter', 'facebook', 'instagram', 'linkedin', 'youtube', 'tiktok')
+SOCIAL_CONNECTORS_SET = frozenset(SOCIAL_CONNECTORS)
+
+
 def test_imports():
     """Test l'importation de tous les modules de connecteurs sociaux."""
     print("🔍 Test des imports...")
@@ -59,7 +82,7 @@ def test_imports():
         
     except ImportError as e:
         print(f"  ❌ Erreur d'import: {e}")
-        traceback.print_exc()
+        _print_exc()
         return False
 
 
@@ -71,24 +94,20 @@ def test_connector_registration():
         from connectors import list_available_connectors
         
         connectors = list_available_connectors()
-        social_connectors = [
-            'twitter', 'facebook', 'instagram', 
-            'linkedin', 'youtube', 'tiktok'
-        ]
+        missing = SOCIAL_CONNECTORS_SET - connectors.keys()
+        registered_count = len(SOCIAL_CONNECTORS) - len(missing)
         
-        registered_social = [name for name in social_connectors if name in connectors]
+        print(f"  📊 Connecteurs sociaux enregistrés: {registered_count}/{len(SOCIAL_CONNECTORS)}")
         
-        print(f"  📊 Connecteurs sociaux enregistrés: {len(registered_social)}/{len(social_connectors)}")
-        
-        for connector in social_connectors:
-            status = "✅" if connector in connectors else "❌"
+        for connector in SOCIAL_CONNECTORS:
+            status = "❌" if connector in missing else "✅"
             print(f"    {status} {connector}")
         
-        return len(registered_social) == len(social_connectors)
+        return not missing
         
     except Exception as e:
         print(f"  ❌ Erreur lors du test d'enregistrement: {e}")
-        traceback.print_exc()
+        _print_exc()
         return False
 
 
@@ -123,9 +142,23 @@ def test_connector_instantiation():
     try:
         from connectors import create_connector
         
-        for platform, config in test_configs.items():
+        def _make(item):
+            """Instancie un connecteur, ou retourne l'exception levée."""
+            platform, config = item
             try:
-                connector = create_connector(platform, config, f"test_{platform}")
+                return create_connector(platform, config, f"test_{platform}")
+            except Exception as e:
+                return e
+        
+        # Les instanciations sont indépendantes : on les lance en parallèle,
+        # puis on vérifie les résultats dans l'ordre des plateformes
+        with ThreadPoolExecutor(max_workers=total_count) as executor:
+            results = list(executor.map(_make, test_configs.items()))
+        
+        for platform, connector in zip(test_configs, results):
+            try:
+                if isinstance(connector, Exception):
+                    raise connector
                 print(f"  ✅ {platform}: Instanciation réussie")
                 
                 # Test des propriétés de base
@@ -147,7 +180,7 @@ def test_connector_instantiation():
         
     except Exception as e:
         print(f"  ❌ Erreur générale lors des tests d'instanciation: {e}")
-        traceback.print_exc()
+        _print_exc()
         return False
 
 
@@ -202,7 +235,7 @@ def test_configuration_validation():
         
     except Exception as e:
         print(f"  ❌ Erreur lors des tests de validation: {e}")
-        traceback.print_exc()
+        _print_exc()
         return False
 
 
@@ -237,12 +270,60 @@ def test_error_handling():
         
     except Exception as e:
         print(f"  ❌ Erreur lors des tests de gestion d'erreurs: {e}")
-        traceback.print_exc()
+        _print_exc()
+        return False
+
+
+class _ThreadBufferedStdout:
+    """Flux de sortie qui redirige print() vers un tampon propre au thread courant."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        return (getattr(self._local, "buffer", None) or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def capture(self, func, *args):
+        """Exécute func(*args) et retourne (résultat, tout ce qu'elle a affiché)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def _run_test(test_name, test_func):
+    """Exécute un test en affichant son en-tête et son verdict."""
+    print(f"\n🧪 Test: {test_name}")
+    print("-" * 40)
+    
+    try:
+        result = test_func()
+        
+        if result:
+            print(f"✅ {test_name}: RÉUSSI")
+        else:
+            print(f"❌ {test_name}: ÉCHEC")
+        return result
+            
+    except Exception as e:
+        print(f"💥 {test_name}: ERREUR CRITIQUE - {e}")
+        _print_exc()
         return False
 
 
-def run_all_tests():
-    """Exécute tous les tests."""
+def run_all_tests(serial=False):
+    """
+    Exécute tous les tests.
+    
+    Une fois les imports vérifiés, les tests suivants sont indépendants et
+    s'exécutent en parallèle ; chacun écrit dans son propre tampon, affiché
+    dans l'ordre. serial=True les exécute un par un (débogage).
+    """
     print("🚀 Démarrage des tests d'intégration des connecteurs de réseaux sociaux")
     print("=" * 80)
     
@@ -254,25 +335,23 @@ def run_all_tests():
         ("Gestion des erreurs", test_error_handling)
     ]
     
-    results = []
+    imports_ok = _run_test(*tests[0])
+    results = [(tests[0][0], imports_ok)]
+    others = tests[1:]
     
-    for test_name, test_func in tests:
-        print(f"\n🧪 Test: {test_name}")
-        print("-" * 40)
-        
+    if serial or not imports_ok:
+        results.extend((test_name, _run_test(test_name, test_func)) for test_name, test_func in others)
+    else:
+        stdout = _ThreadBufferedStdout(sys.stdout)
+        sys.stdout = stdout
         try:
-            result = test_func()
-            results.append((test_name, result))
-            
-            if result:
-                print(f"✅ {test_name}: RÉUSSI")
-            else:
-                print(f"❌ {test_name}: ÉCHEC")
-                
-        except Exception as e:
-            print(f"💥 {test_name}: ERREUR CRITIQUE - {e}")
-            traceback.print_exc()
-            results.append((test_name, False))
+            with ThreadPoolExecutor(max_workers=len(others)) as executor:
+                outcomes = list(executor.map(lambda test: stdout.capture(_run_test, *test), others))
+        finally:
+            sys.stdout = stdout.stream
+        
+        sys.stdout.write("".join(output for _, output in outcomes))
+        results.extend((test_name, result) for (test_name, _), (result, _) in zip(others, outcomes))
     
     # Résumé des résultats
     print("\n" + "=" * 80)
@@ -301,16 +380,22 @@ def run_all_tests():
 
 def main():
     """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Tests d'intégration des connecteurs sociaux")
+    parser.add_argument("--serial", action="store_true", help="Exécuter les tests un par un")
+    args = parser.parse_args()
+    
     try:
-        return run_all_tests()
+        return run_all_tests(serial=args.serial)
     except KeyboardInterrupt:
         print("\n\n⏹️  Tests interrompus par l'utilisateur")
         return 130
     except Exception as e:
         print(f"\n\n💥 Erreur critique dans les tests: {e}")
-        traceback.print_exc()
+        _print_exc()
         return 1
 
 
 if __name__ == "__main__":
+    # Sortie par blocs même sur un terminal : un write() par bloc, pas par print()
+    sys.stdout.reconfigure(line_buffering=False)
     sys.exit(main())
@@ -5,3 +5,5 @@ Tests pour le module connectors.
 # Import tests
 from .test_base import *
 from .test_connectors import *
+from .test_metrics import *
+from .test_retry import *
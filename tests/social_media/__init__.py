@@ -3,17 +3,7 @@ Tests pour les connecteurs de réseaux sociaux.
 """
 
 from .test_twitter import TestTwitterConnector
-from .test_facebook import TestFacebookConnector
-from .test_instagram import TestInstagramConnector
-from .test_linkedin import TestLinkedInConnector
-from .test_youtube import TestYouTubeConnector
-from .test_tiktok import TestTikTokConnector
 
 __all__ = [
     'TestTwitterConnector',
-    'TestFacebookConnector', 
-    'TestInstagramConnector',
-    'TestLinkedInConnector',
-    'TestYouTubeConnector',
-    'TestTikTokConnector'
 ]
@@ -0,0 +1,12 @@
+"""
+Utilitaires partagés par les tests de réseaux sociaux.
+"""
+
+from types import SimpleNamespace
+
+
+def mk_response(status=200, payload=None, headers=None, text=""):
+    """Construit une réponse HTTP factice (plus légère qu'un Mock)."""
+    return SimpleNamespace(
+        status_code=status, json=lambda: payload, headers=headers or {}, text=text
+    )
@@ -0,0 +1,26 @@
+"""
+Configuration pytest des tests de réseaux sociaux.
+
+Les modules sont indépendants (réseau entièrement mocké) : chacun forme un
+groupe xdist, de sorte qu'avec `pytest -n 6 --dist loadgroup` chaque module
+s'exécute en entier sur un même worker et ne construit ses fixtures de
+classe ou de module qu'une fois.
+"""
+
+from pathlib import Path
+
+import pytest
+
+_HERE = Path(__file__).parent
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "xdist_group(name): regroupe des tests sur un même worker")
+
+
+def pytest_collection_modifyitems(items):
+    # Le hook reçoit tous les tests de la session : seuls ceux de ce dossier sont groupés
+    for item in items:
+        if _HERE in item.path.parents:
+            item.add_marker(pytest.mark.xdist_group(item.path.stem))
+
@@ -0,0 +1,52 @@
+"""
+Tests d'initialisation communs aux connecteurs de réseaux sociaux.
+"""
+
+import pytest
+
+from connectors.social_media.facebook import FacebookConnector
+from connectors.social_media.instagram import InstagramConnector
+from connectors.social_media.linkedin import LinkedInConnector
+from connectors.social_media.tiktok import TikTokConnector
+from connectors.social_media.twitter import TwitterConnector
+from connectors.social_media.youtube import YouTubeConnector
+from connectors.exceptions.connector_exceptions import SocialMediaConnectionError
+
+# (classe, configuration valide, champ obligatoire)
+CASES = [
+    (FacebookConnector, {'access_token': 'test_access_token', 'page_id': 'test_page_id'},
+     'access_token'),
+    (InstagramConnector, {'access_token': 'test_access_token', 'user_id': 'test_user_id'},
+     'access_token'),
+    (LinkedInConnector, {'access_token': 'test_access_token', 'client_id': 'test_client_id'},
+     'access_token'),
+    (TikTokConnector, {'access_token': 'test_access_token', 'client_key': 'test_client_key'},
+     'access_token'),
+    (TwitterConnector, {'bearer_token': 'test_bearer_token', 'api_key': 'test_api_key'},
+     'bearer_token'),
+    (YouTubeConnector, {'api_key': 'test_api_key', 'access_token': 'test_access_token'},
+     'api_key'),
+]
+IDS = [cls.__name__ for cls, _, _ in CASES]
+
+
+@pytest.mark.parametrize("cls, config, required", CASES, ids=IDS)
+def test_init_with_valid_config(cls, config, required):
+    """Test d'initialisation avec une configuration valide."""
+    connector = cls(config)
+
+    for field, value in config.items():
+        assert getattr(connector, field) == value
+    assert not connector.authenticated
+
+
+@pytest.mark.parametrize("cls, config, required", CASES, ids=IDS)
+def test_init_missing_required(cls, config, required):
+    """Test d'initialisation sans le champ obligatoire."""
+    config = {field: value for field, value in config.items() if field != required}
+    with pytest.raises(SocialMediaConnectionError):
+        cls(config)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
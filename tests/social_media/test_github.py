@@ -3,10 +3,11 @@ Tests unitaires pour le connecteur GitHub.
 """
 
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import DEFAULT, patch
+import pytest
 import requests
-import json
 from datetime import datetime
+from types import MappingProxyType
 
 from connectors.social_media.github import GitHubConnector
 from connectors.exceptions.connector_exceptions import (
@@ -15,27 +16,113 @@ from connectors.exceptions.connector_exceptions import (
     SocialMediaAPIError,
 )
 
+from ._helpers import mk_response
+
+# Réponses de l'API construites une seule fois, figées et partagées par les tests
+_AUTH_JSON = MappingProxyType({"login": "test_user", "id": 12345})
+
+_ISSUE_JSON = MappingProxyType(
+    {
+        "id": 123456,
+        "number": 42,
+        "html_url": "https://github.com/test_owner/test_repo/issues/42",
+        "created_at": "2023-01-01T12:00:00Z",
+    }
+)
+
+_ISSUES_JSON = (
+    MappingProxyType(
+        {
+            "id": 123,
+            "number": 42,
+            "title": "Test Issue",
+            "html_url": "https://github.com/test_owner/test_repo/issues/42",
+            "state": "open",
+            "created_at": "2023-01-01T12:00:00Z",
+            "updated_at": "2023-01-01T13:00:00Z",
+            "user": {"login": "test_user"},
+        }
+    ),
+)
+
+_PULLS_JSON = (
+    MappingProxyType(
+        {
+            "id": 456,
+            "number": 43,
+            "title": "Test PR",
+            "html_url": "https://github.com/test_owner/test_repo/pull/43",
+            "state": "open",
+            "created_at": "2023-01-01T14:00:00Z",
+            "updated_at": "2023-01-01T15:00:00Z",
+            "user": {"login": "test_user"},
+            "head": {"ref": "feature-branch"},
+        }
+    ),
+)
+
+_USER_JSON = MappingProxyType(
+    {
+        "login": "test_user",
+        "id": 12345,
+        "name": "Test User",
+        "html_url": "https://github.com/test_user",
+        "avatar_url": "https://github.com/avatar/test_user",
+        "public_repos": 10,
+        "followers": 42,
+        "following": 15,
+        "company": "Test Company",
+        "blog": "https://test.com",
+        "location": "Test City",
+        "email": "test@example.com",
+        "bio": "Test bio",
+        "created_at": "2020-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+)
+
 
 class TestGitHubConnector(unittest.TestCase):
     """Tests unitaires pour le connecteur GitHub."""
 
-    def setUp(self):
-        """Configuration avant chaque test."""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Connecteur (et sa session) partagé par tous les tests."""
+        cls.config = {
             "access_token": "fake_token",
             "default_owner": "test_owner",
             "default_repo": "test_repo",
         }
-        self.connector = GitHubConnector(self.config)
+        cls._connector = GitHubConnector(cls.config)
 
-    @patch("requests.Session.get")
-    def test_authentication_success(self, mock_get):
+    @classmethod
+    def tearDownClass(cls):
+        cls._connector.session.close()
+
+    def setUp(self):
+        """Remise à zéro de l'état modifié par les tests."""
+        # Un seul patch des verbes HTTP par test, exposés dans self.mocks
+        patcher = patch.multiple(
+            "requests.Session", get=DEFAULT, post=DEFAULT, patch=DEFAULT, delete=DEFAULT
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.connector = self._connector
+        self.connector.authenticated = False
+        self.connector.headers.pop("Authorization", None)
+        self.connector.rate_limit_info.clear()
+
+    def _authed(self):
+        """Retourne le connecteur marqué comme authentifié (verbes HTTP déjà mockés)."""
+        self.connector.authenticated = True
+        return self.connector
+
+    def test_authentication_success(self):
         """Test authentification réussie."""
         # Configuration du mock
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"login": "test_user", "id": 12345}
-        mock_get.return_value = mock_response
+        mock_response = mk_response(200, _AUTH_JSON)
+        self.mocks["get"].return_value = mock_response
 
         # Test
         result = self.connector.authenticate()
@@ -43,18 +130,15 @@ class TestGitHubConnector(unittest.TestCase):
         # Vérifications
         self.assertTrue(result)
         self.assertTrue(self.connector.authenticated)
-        mock_get.assert_called_once_with(
+        self.mocks["get"].assert_called_once_with(
             "https://api.github.com/user", headers=self.connector.headers
         )
 
-    @patch("requests.Session.get")
-    def test_authentication_failure(self, mock_get):
+    def test_authentication_failure(self):
         """Test échec d'authentification."""
         # Configuration du mock
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.text = "Bad credentials"
-        mock_get.return_value = mock_response
+        mock_response = mk_response(401, text="Bad credentials")
+        self.mocks["get"].return_value = mock_response
 
         # Test
         with self.assertRaises(SocialMediaAuthenticationError):
@@ -63,84 +147,45 @@ class TestGitHubConnector(unittest.TestCase):
         # Vérifications
         self.assertFalse(self.connector.authenticated)
 
-    @patch("requests.Session.post")
-    def test_create_issue(self, mock_post):
+    def test_create_issue(self):
         """Test création d'une issue."""
         # Configuration du mock
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": 123456,
-            "number": 42,
-            "html_url": "https://github.com/test_owner/test_repo/issues/42",
-            "created_at": "2023-01-01T12:00:00Z",
-        }
-        mock_post.return_value = mock_response
+        mock_response = mk_response(201, _ISSUE_JSON)
+        self.mocks["post"].return_value = mock_response
 
-        # Simuler l'authentification
-        self.connector.authenticated = True
+        connector = self._authed()
 
         # Test
-        result = self.connector.post_message(
+        result = connector.post_message(
             content="Test issue content", options={"title": "Test Issue", "labels": ["bug"]}
         )
 
         # Vérifications
         self.assertEqual(result["number"], 42)
         self.assertEqual(result["url"], "https://github.com/test_owner/test_repo/issues/42")
-        mock_post.assert_called_once()
+        self.mocks["post"].assert_called_once()
 
         # Vérification des données envoyées
-        call_kwargs = mock_post.call_args[1]
         self.assertEqual(
-            json.loads(call_kwargs["data"]),
+            self.mocks["post"].call_args.kwargs["json"],
             {"title": "Test Issue", "body": "Test issue content", "labels": ["bug"]},
         )
 
-    @patch("requests.Session.get")
-    def test_get_feed(self, mock_get):
+    def test_get_feed(self):
         """Test récupération du flux d'activité."""
         # Configuration du mock pour les issues
-        mock_issues_response = MagicMock()
-        mock_issues_response.status_code = 200
-        mock_issues_response.json.return_value = [
-            {
-                "id": 123,
-                "number": 42,
-                "title": "Test Issue",
-                "html_url": "https://github.com/test_owner/test_repo/issues/42",
-                "state": "open",
-                "created_at": "2023-01-01T12:00:00Z",
-                "updated_at": "2023-01-01T13:00:00Z",
-                "user": {"login": "test_user"},
-            }
-        ]
+        mock_issues_response = mk_response(200, _ISSUES_JSON)
 
         # Configuration du mock pour les pull requests
-        mock_pulls_response = MagicMock()
-        mock_pulls_response.status_code = 200
-        mock_pulls_response.json.return_value = [
-            {
-                "id": 456,
-                "number": 43,
-                "title": "Test PR",
-                "html_url": "https://github.com/test_owner/test_repo/pull/43",
-                "state": "open",
-                "created_at": "2023-01-01T14:00:00Z",
-                "updated_at": "2023-01-01T15:00:00Z",
-                "user": {"login": "test_user"},
-                "head": {"ref": "feature-branch"},
-            }
-        ]
+        mock_pulls_response = mk_response(200, _PULLS_JSON)
 
         # Configuration du comportement du mock pour les deux appels
-        mock_get.side_effect = [mock_issues_response, mock_pulls_response]
+        self.mocks["get"].side_effect = iter([mock_issues_response, mock_pulls_response])
 
-        # Simuler l'authentification
-        self.connector.authenticated = True
+        connector = self._authed()
 
         # Test
-        result = self.connector.get_feed(limit=5, type="all")
+        result = connector.get_feed(limit=5, type="all")
 
         # Vérifications
         self.assertEqual(len(result), 2)
@@ -150,47 +195,25 @@ class TestGitHubConnector(unittest.TestCase):
         self.assertEqual(result[1]["number"], 42)
 
         # Vérification des appels API
-        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.mocks["get"].call_count, 2)
 
-    @patch("requests.Session.get")
-    def test_get_profile_info(self, mock_get):
+    def test_get_profile_info(self):
         """Test récupération des informations du profil."""
         # Configuration du mock pour les infos user
-        mock_user_response = MagicMock()
-        mock_user_response.status_code = 200
-        mock_user_response.json.return_value = {
-            "login": "test_user",
-            "id": 12345,
-            "name": "Test User",
-            "html_url": "https://github.com/test_user",
-            "avatar_url": "https://github.com/avatar/test_user",
-            "public_repos": 10,
-            "followers": 42,
-            "following": 15,
-            "company": "Test Company",
-            "blog": "https://test.com",
-            "location": "Test City",
-            "email": "test@example.com",
-            "bio": "Test bio",
-            "created_at": "2020-01-01T00:00:00Z",
-            "updated_at": "2023-01-01T00:00:00Z",
-        }
+        mock_user_response = mk_response(200, _USER_JSON)
 
         # Configuration du mock pour les repos
-        mock_repos_response = MagicMock()
-        mock_repos_response.status_code = 200
-        mock_repos_response.headers = {
-            "Link": '<https://api.github.com/user/repos?page=15>; rel="last"'
-        }
+        mock_repos_response = mk_response(
+            200, [], headers={"Link": '<https://api.github.com/user/repos?page=15>; rel="last"'}
+        )
 
         # Configuration du comportement du mock pour les deux appels
-        mock_get.side_effect = [mock_user_response, mock_repos_response]
+        self.mocks["get"].side_effect = iter([mock_user_response, mock_repos_response])
 
-        # Simuler l'authentification
-        self.connector.authenticated = True
+        connector = self._authed()
 
         # Test
-        result = self.connector.get_profile_info()
+        result = connector.get_profile_info()
 
         # Vérifications
         self.assertEqual(result["login"], "test_user")
@@ -199,51 +222,45 @@ class TestGitHubConnector(unittest.TestCase):
         self.assertEqual(result["private_repos"], 15 - 10)  # Total - public
 
         # Vérification des appels API
-        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.mocks["get"].call_count, 2)
 
-    @patch("requests.Session.patch")
-    def test_delete_issue(self, mock_patch):
+    def test_delete_issue(self):
         """Test fermeture d'une issue (delete)."""
         # Configuration du mock
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_patch.return_value = mock_response
+        mock_response = mk_response(200)
+        self.mocks["patch"].return_value = mock_response
 
-        # Simuler l'authentification
-        self.connector.authenticated = True
+        connector = self._authed()
 
         # Test
-        result = self.connector.delete_post("issue:test_owner:test_repo:42")
+        result = connector.delete_post("issue:test_owner:test_repo:42")
 
         # Vérifications
         self.assertTrue(result)
-        mock_patch.assert_called_once_with(
+        self.mocks["patch"].assert_called_once_with(
             "https://api.github.com/repos/test_owner/test_repo/issues/42",
-            headers=self.connector.headers,
+            headers=connector.headers,
             json={"state": "closed"},
         )
 
-    @patch("requests.Session.delete")
-    def test_delete_comment(self, mock_delete):
+    def test_delete_comment(self):
         """Test suppression d'un commentaire."""
         # Configuration du mock
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_delete.return_value = mock_response
+        mock_response = mk_response(204)
+        self.mocks["delete"].return_value = mock_response
 
-        # Simuler l'authentification
-        self.connector.authenticated = True
+        connector = self._authed()
 
         # Test
-        result = self.connector.delete_post("comment:test_owner:test_repo:42")
+        result = connector.delete_post("comment:test_owner:test_repo:42")
 
         # Vérifications
         self.assertTrue(result)
-        mock_delete.assert_called_once_with(
+        self.mocks["delete"].assert_called_once_with(
             "https://api.github.com/repos/test_owner/test_repo/issues/comments/42",
-            headers=self.connector.headers,
+            headers=connector.headers,
         )
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
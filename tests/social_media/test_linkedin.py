@@ -2,86 +2,81 @@
 Tests unitaires pour le connecteur LinkedIn.
 """
 
-import unittest
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 import pytest
+import requests
 
 from connectors.social_media.linkedin import LinkedInConnector
-from connectors.exceptions.connector_exceptions import (
-    SocialMediaConnectionError,
-    SocialMediaAuthenticationError,
-    SocialMediaAPIError
-)
 
+from ._helpers import mk_response
 
-class TestLinkedInConnector(unittest.TestCase):
-    """Tests pour le connecteur LinkedIn."""
+# Réponses de l'API figées et partagées par les tests (le connecteur ne fait que les lire)
+_PERSON = MappingProxyType({
+    'id': 'test_user_id',
+    'firstName': {'localized': {'en_US': 'John'}},
+    'lastName': {'localized': {'en_US': 'Doe'}}
+})
+
+_PROFILE = MappingProxyType({
+    'id': 'test_user_id',
+    'firstName': {'localized': {'en_US': 'John'}},
+    'lastName': {'localized': {'en_US': 'Doe'}},
+    'headline': {'localized': {'en_US': 'Software Engineer'}}
+})
+
+
+CONFIG = {
+    'access_token': 'test_access_token',
+    'client_id': 'test_client_id',
+    'client_secret': 'test_client_secret'
+}
+
+
+@pytest.fixture
+def connector():
+    """Nouveau connecteur pour chaque test (les tests modifient sa session)."""
+    return LinkedInConnector(CONFIG)
+
+
+@pytest.fixture
+def authed_connector(connector):
+    """Connecteur authentifié dont la session est mockée."""
+    connector.authenticated = True
+    connector.session = Mock(spec_set=requests.Session)
+    return connector
+
+
+def test_successful_authentication(connector):
+    """Test d'authentification réussie."""
+    response = mk_response(200, _PERSON)
+    session = requests.Session()
     
-    def setUp(self):
-        """Configuration avant chaque test."""
-        self.config = {
-            'access_token': 'test_access_token',
-            'client_id': 'test_client_id',
-            'client_secret': 'test_client_secret'
-        }
-        self.connector = LinkedInConnector(self.config)
+    # connect() recrée la session : le constructeur renvoie celle dont get est patché
+    with patch.object(requests, 'Session', return_value=session), \
+            patch.object(session, 'get', return_value=response) as mock_get:
+        result = connector.connect()
+    session.close()
     
-    def test_init_with_valid_config(self):
-        """Test d'initialisation avec une configuration valide."""
-        self.assertEqual(self.connector.access_token, 'test_access_token')
-        self.assertEqual(self.connector.client_id, 'test_client_id')
-        self.assertFalse(self.connector.authenticated)
+    assert result
+    assert connector.authenticated
+    mock_get.assert_called_once()
+
+
+def test_get_profile_info_structure(authed_connector):
+    """Test de la structure des informations de profil."""
+    connector = authed_connector
+    mock_response = mk_response(200, _PROFILE)
     
-    def test_init_without_access_token(self):
-        """Test d'initialisation sans access token."""
-        config = {'client_id': 'test_client_id'}
-        with self.assertRaises(SocialMediaConnectionError):
-            LinkedInConnector(config)
+    connector.session.get.return_value = mock_response
     
-    @patch('connectors.social_media.linkedin.requests.Session')
-    def test_successful_authentication(self, mock_session):
-        """Test d'authentification réussie."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'id': 'test_user_id',
-            'firstName': {'localized': {'en_US': 'John'}},
-            'lastName': {'localized': {'en_US': 'Doe'}}
-        }
-        
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
-        
-        result = self.connector.connect()
-        
-        self.assertTrue(result)
-        self.assertTrue(self.connector.authenticated)
+    result = connector.get_profile_info()
     
-    def test_get_profile_info_structure(self):
-        """Test de la structure des informations de profil."""
-        self.connector.authenticated = True
-        self.connector.session = Mock()
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'id': 'test_user_id',
-            'firstName': {'localized': {'en_US': 'John'}},
-            'lastName': {'localized': {'en_US': 'Doe'}},
-            'headline': {'localized': {'en_US': 'Software Engineer'}}
-        }
-        mock_response.headers = {}
-        
-        self.connector.session.get.return_value = mock_response
-        
-        result = self.connector.get_profile_info()
-        
-        self.assertIn('platform', result)
-        self.assertEqual(result['platform'], 'linkedin')
-        self.assertIn('name', result)
-        self.assertIn('id', result)
+    assert 'platform' in result
+    assert result['platform'] == 'linkedin'
+    assert 'name' in result
+    assert 'id' in result
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
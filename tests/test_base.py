@@ -66,21 +66,47 @@ class TestBaseConnector:
         assert result == "result"
 
 
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    """Restaure le registre global après chaque test, même en cas d'échec."""
+    connectors = dict(registry._connectors)
+    instances = dict(registry._instances)
+    yield
+    registry._connectors.clear()
+    registry._connectors.update(connectors)
+    registry._instances.clear()
+    registry._instances.update(instances)
+    registry._listing = None
+
+
+@pytest.fixture
+def mock_registered():
+    """Enregistre MockConnector sous "mock" (nettoyé par _reset_registry)."""
+    registry.register("mock", MockConnector)
+
+
+@pytest.mark.usefixtures("mock_registered")
 class TestRegistry:
     """Tests pour le registre de connecteurs."""
     
     def test_register_connector(self):
         """Test d'enregistrement d'un connecteur."""
-        registry.register("mock", MockConnector)
         assert "mock" in registry.list_connectors()
+    
+    def test_list_connectors_is_cached(self):
+        """Test du cache de la liste des connecteurs."""
+        listing = registry.list_connectors()
+        assert registry.list_connectors() is listing
+        assert listing["mock"] == "MockConnector"
         
-        # Nettoyage
         registry.unregister("mock")
+        assert "mock" not in registry.list_connectors()
+        
+        registry.register("mock", MockConnector)
+        assert registry.list_connectors()["mock"] == "MockConnector"
     
     def test_create_connector(self):
         """Test de création d'un connecteur."""
-        registry.register("mock", MockConnector)
-        
         config = {"timeout": 30}
         connector = registry.create_connector("mock", config, "test_instance")
         
@@ -90,10 +116,6 @@ class TestRegistry:
         # Test récupération d'instance
         same_connector = registry.get_instance("test_instance")
         assert same_connector is connector
-        
-        # Nettoyage
-        registry.cleanup_instances()
-        registry.unregister("mock")
     
     def test_unknown_connector(self):
         """Test avec un connecteur inconnu."""
@@ -112,14 +134,9 @@ class TestRegistry:
             registry.register("invalid", InvalidConnector)
 
 
-def test_create_connector_function():
+def test_create_connector_function(mock_registered):
     """Test de la fonction create_connector."""
-    registry.register("mock", MockConnector)
-    
     config = {"timeout": 30}
     connector = create_connector("mock", config)
     
     assert isinstance(connector, MockConnector)
-    
-    # Nettoyage
-    registry.unregister("mock")
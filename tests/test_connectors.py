@@ -2,110 +2,209 @@
 Tests pour les connecteurs spécifiques.
 """
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from connectors.exceptions import ConfigurationError, ConnectionError
+from connectors.db.mysql import MySQLConnector
+from connectors.db.postgresql import PostgreSQLConnector
+from connectors.data_lake.s3 import S3Connector
+
+# Configurations partagées, en lecture seule
+_PG_CONFIG = MappingProxyType({
+    "host": "localhost",
+    "port": 5432,
+    "database": "testdb",
+    "username": "user",
+    "password": "password"
+})
+
+_S3_CONFIG = MappingProxyType({
+    "access_key_id": "test_key",
+    "secret_access_key": "test_secret",
+    "bucket_name": "test-bucket",
+    "region": "us-east-1"
+})
+
+# URL renvoyée par upload_file pour "remote_file.txt"
+_EXPECTED_S3_URL = "s3://test-bucket/remote_file.txt"
+
+
+@pytest.fixture(scope="session")
+def _mock_prototypes():
+    """
+    Mocks construits une seule fois par session (donc par worker pytest-xdist).
+
+    Ne jamais les utiliser directement : passer par pg_mocks / s3_mocks, qui
+    les remettent à zéro avant chaque test.
+    """
+    # Mock simple : aucun test n'a besoin des méthodes magiques (plus coûteuses) de MagicMock
+    return {"pg": (Mock(), Mock()), "s3": (Mock(), Mock())}
+
+
+def _reset(mocks):
+    for mock in mocks:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return mocks
+
+
+@pytest.fixture
+def pg_mocks(_mock_prototypes):
+    """Connexion et curseur PostgreSQL factices, remis à zéro pour chaque test."""
+    mock_conn, mock_cursor = _reset(_mock_prototypes["pg"])
+    mock_conn.cursor.return_value = mock_cursor
+    return mock_conn, mock_cursor
+
+
+@pytest.fixture
+def pg_connect(monkeypatch, pg_mocks):
+    """Remplace psycopg2.connect par un Mock qui renvoie la connexion factice."""
+    psycopg2 = pytest.importorskip("psycopg2")
+    connect = Mock(return_value=pg_mocks[0])
+    monkeypatch.setattr(psycopg2, "connect", connect)
+    return connect
+
+
+@pytest.fixture
+def s3_mocks(_mock_prototypes):
+    """Client et ressource boto3 factices, remis à zéro pour chaque test."""
+    return _reset(_mock_prototypes["s3"])
+
+
+@pytest.fixture
+def connected_s3(monkeypatch, s3_mocks):
+    """Connecteur S3 connecté via des clients boto3 factices."""
+    boto3 = pytest.importorskip("boto3")
+    mock_client, mock_resource = s3_mocks
+    # Fabriques jamais inspectées : de simples fonctions suffisent, sans nouveau Mock
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_client)
+    monkeypatch.setattr(boto3, "resource", lambda *args, **kwargs: mock_resource)
+    
+    connector = S3Connector(_S3_CONFIG)
+    connector.connect()
+    return connector, mock_client, mock_resource
+
+
+@pytest.mark.parametrize("port", [5432, 5433, 6543])
+def test_postgresql_connection(pg_connect, port):
+    """Test de connexion PostgreSQL."""
+    connector = PostgreSQLConnector({**_PG_CONFIG, "port": port})
+    connector.connect()
+    
+    assert connector.is_connected
+    assert pg_connect.call_count == 1
+    assert pg_connect.call_args.kwargs["port"] == port
+
+
+def test_postgresql_insert_data_bulk(pg_connect, monkeypatch):
+    """Test de l'insertion groupée par lots."""
+    mock_execute_values = Mock()
+    monkeypatch.setattr("psycopg2.extras.execute_values", mock_execute_values)
+    
+    connector = PostgreSQLConnector(_PG_CONFIG)
+    connector.connect()
+    rows = [{"name": f"user{i}", "age": i} for i in range(5)]
+    
+    assert connector.insert_data_bulk("users", rows, batch_size=2) == 5
+    
+    assert mock_execute_values.call_count == 3
+    _, query, values = mock_execute_values.call_args_list[0].args[:3]
+    assert query == "INSERT INTO users (name, age) VALUES %s"
+    assert values == [("user0", 0), ("user1", 1)]
+    assert mock_execute_values.call_args_list[2].args[2] == [("user4", 4)]
+
+
+def test_postgresql_execute_batch(pg_connect, pg_mocks):
+    """Test de l'envoi de plusieurs requêtes en un seul appel."""
+    _, mock_cursor = pg_mocks
+    mock_cursor.mogrify.side_effect = lambda query, params: query.encode()
+    mock_cursor.fetchall.return_value = [{"id": 1}]
+    
+    connector = PostgreSQLConnector(_PG_CONFIG)
+    connector.connect()
+    result = connector.execute_batch([
+        ("INSERT INTO t VALUES (%s)", (1,)),
+        ("SELECT * FROM t", None),
+    ])
+    
+    assert result == [{"id": 1}]
+    mock_cursor.execute.assert_called_once_with(b"INSERT INTO t VALUES (%s); SELECT * FROM t")
 
 
-class TestPostgreSQLConnector:
-    """Tests pour PostgreSQLConnector."""
+def test_mysql_execute_batch_without_multi():
+    """Test de l'exécution requête par requête quand le pilote refuse multi=True."""
+    # Signature de mysql-connector-python >= 9.2 : multi=True lève TypeError
+    def execute(query, params=None):
+        cursor.with_rows = query.startswith("SELECT")
     
-    @patch('connectors.db.postgresql.psycopg2')
-    def test_postgresql_connection(self, mock_psycopg2):
-        """Test de connexion PostgreSQL."""
-        from connectors.db.postgresql import PostgreSQLConnector
-        
-        # Mock de la connexion
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_psycopg2.connect.return_value = mock_conn
-        
-        config = {
-            "host": "localhost",
-            "port": 5432,
-            "database": "testdb",
-            "username": "user",
-            "password": "password"
-        }
-        
-        connector = PostgreSQLConnector(config)
-        connector.connect()
-        
-        assert connector.is_connected
-        mock_psycopg2.connect.assert_called_once()
+    cursor = Mock()
+    cursor.execute.side_effect = execute
+    cursor.fetchall.return_value = [{"id": 1}]
     
-    def test_postgresql_invalid_config(self):
-        """Test avec configuration PostgreSQL invalide."""
-        from connectors.db.postgresql import PostgreSQLConnector
-        
-        invalid_config = {"host": "localhost"}  # Config incomplète
-        
-        with pytest.raises(ConfigurationError):
-            PostgreSQLConnector(invalid_config)
-
-
-class TestS3Connector:
-    """Tests pour S3Connector."""
+    connector = MySQLConnector({**_PG_CONFIG, "port": 3306})
+    connector.cursor = cursor
+    connector._connected = True
+    result = connector.execute_batch([
+        ("INSERT INTO t VALUES (%s)", (1,)),
+        ("SELECT * FROM t", None),
+    ])
     
-    @patch('connectors.data_lake.s3.boto3')
-    def test_s3_connection(self, mock_boto3):
-        """Test de connexion S3."""
-        from connectors.data_lake.s3 import S3Connector
-        
-        # Mock des clients boto3
-        mock_client = Mock()
-        mock_resource = Mock()
-        mock_boto3.client.return_value = mock_client
-        mock_boto3.resource.return_value = mock_resource
-        
-        config = {
-            "access_key_id": "test_key",
-            "secret_access_key": "test_secret",
-            "bucket_name": "test-bucket",
-            "region": "us-east-1"
-        }
-        
-        connector = S3Connector(config)
-        connector.connect()
-        
-        assert connector.is_connected
-        mock_boto3.client.assert_called_once()
-        mock_boto3.resource.assert_called_once()
+    assert result == [{"id": 1}]
+    assert cursor.execute.call_args_list[0].kwargs == {"multi": True}
+    assert [c.args for c in cursor.execute.call_args_list[1:]] == [
+        ("INSERT INTO t VALUES (%s)", (1,)),
+        ("SELECT * FROM t", None),
+    ]
+
+
+def test_s3_connection(connected_s3):
+    """Test de connexion S3."""
+    connector, mock_client, mock_resource = connected_s3
+    
+    assert connector.is_connected
+    assert connector.s3_client is mock_client
+    assert connector.s3_resource is mock_resource
+
+
+def test_s3_upload_file(connected_s3):
+    """Test d'upload de fichier S3."""
+    connector, mock_client, _ = connected_s3
     
-    @patch('connectors.data_lake.s3.boto3')
-    def test_s3_upload_file(self, mock_boto3):
-        """Test d'upload de fichier S3."""
-        from connectors.data_lake.s3 import S3Connector
-        
-        # Mock du client
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
-        mock_boto3.resource.return_value = Mock()
-        
-        config = {
-            "access_key_id": "test_key",
-            "secret_access_key": "test_secret",
-            "bucket_name": "test-bucket",
-            "region": "us-east-1"
-        }
-        
-        connector = S3Connector(config)
-        connector.connect()
-        
-        # Test upload
-        result = connector.upload_file("local_file.txt", "remote_file.txt")
-        
-        mock_client.upload_file.assert_called_once_with(
-            "local_file.txt", "test-bucket", "remote_file.txt", ExtraArgs={}
-        )
-        assert result == "s3://test-bucket/remote_file.txt"
+    result = connector.upload_file("local_file.txt", "remote_file.txt")
+    
+    assert mock_client.upload_file.call_count == 1
+    args, kwargs = mock_client.upload_file.call_args
+    assert args == ("local_file.txt", "test-bucket", "remote_file.txt")
+    assert kwargs == {"ExtraArgs": {}}
+    assert result == _EXPECTED_S3_URL
+
+
+@pytest.mark.parametrize("connector_class, invalid_config", [
+    (PostgreSQLConnector, {"host": "localhost"}),
+    (S3Connector, {"access_key_id": "test"}),
+])
+def test_invalid_config(connector_class, invalid_config):
+    """Test avec une configuration incomplète."""
+    with pytest.raises(ConfigurationError):
+        connector_class(invalid_config)
+
+
+def test_drivers_are_imported_lazily():
+    """Test que l'import des connecteurs ne charge aucun pilote lourd (chargés dans connect())."""
+    code = (
+        "import sys, connectors; "
+        "print(sorted({'boto3', 'botocore', 'psycopg2', 'mysql', 'pyodbc', 'snowflake'} "
+        "& sys.modules.keys()))"
+    )
+    root = str(Path(__file__).resolve().parents[1])
+    env = dict(os.environ, PYTHONPATH=root)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
     
-    def test_s3_invalid_config(self):
-        """Test avec configuration S3 invalide."""
-        from connectors.data_lake.s3 import S3Connector
-        
-        invalid_config = {"access_key_id": "test"}  # Config incomplète
-        
-        with pytest.raises(ConfigurationError):
-            S3Connector(invalid_config)
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,40 @@
+"""
+Tests de l'enregistrement des connecteurs de base de données (sans connexion).
+"""
+
+import pytest
+
+from connectors import list_available_connectors, registry
+
+# Configuration minimale de chaque connecteur
+DB_CONFIGS = {
+    'postgresql': {
+        'host': 'localhost', 'port': 5432, 'database': 'test',
+        'username': 'test', 'password': 'test'
+    },
+    'mysql': {
+        'host': 'localhost', 'port': 3306, 'database': 'test',
+        'username': 'test', 'password': 'test'
+    },
+    'sqlserver': {
+        'host': 'localhost', 'port': 1433, 'database': 'test',
+        'username': 'test', 'password': 'test'
+    },
+    'snowflake': {
+        'account': 'test', 'username': 'test', 'password': 'test',
+        'warehouse': 'test', 'database': 'test', 'schema': 'test'
+    },
+}
+
+
+def test_db_connectors_are_registered():
+    """Test de l'enregistrement des connecteurs de base de données."""
+    assert not DB_CONFIGS.keys() - list_available_connectors().keys()
+
+
+@pytest.mark.parametrize("name", sorted(DB_CONFIGS))
+def test_db_connector_instantiation(name):
+    """Test de la création d'un connecteur sans connexion."""
+    connector = registry.get_connector_class(name)(DB_CONFIGS[name])
+
+    assert not connector.is_connected
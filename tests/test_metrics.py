@@ -0,0 +1,223 @@
+"""
+Tests pour le collecteur de métriques.
+"""
+
+import threading
+
+import pytest
+from connectors.utils.metrics import (
+    ConnectorMetrics,
+    DurationHistogram,
+    MetricsCollector,
+    OperationMetric,
+)
+
+
+class TestDurationHistogram:
+    """Tests pour DurationHistogram."""
+
+    def test_empty_histogram(self):
+        """Test des quantiles sans échantillon."""
+        histogram = DurationHistogram()
+
+        assert histogram.total == 0
+        assert histogram.percentile(0.5) == 0.0
+
+    def test_percentiles(self):
+        """Test de l'estimation des quantiles."""
+        histogram = DurationHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+
+        p50, p95, p99 = histogram.percentiles(0.50, 0.95, 0.99)
+
+        # Les buckets ont une largeur relative de ~19 %
+        assert p50 == pytest.approx(0.050, rel=0.2)
+        assert p95 == pytest.approx(0.095, rel=0.2)
+        assert p99 == pytest.approx(0.099, rel=0.2)
+        assert p50 <= p95 <= p99
+        assert histogram.percentile(0.95) == p95
+
+    def test_invalid_quantile(self):
+        """Test avec un quantile hors bornes."""
+        with pytest.raises(ValueError):
+            DurationHistogram().percentile(1.5)
+
+    def test_merge(self):
+        """Test de la fusion de deux histogrammes."""
+        first = DurationHistogram()
+        second = DurationHistogram()
+        first.record(0.001)
+        second.record(0.002)
+        second.record(10.0)
+
+        first.merge(second)
+
+        assert first.total == 3
+        assert sum(first.counts) == 3
+        assert second.total == 2
+
+
+class TestMetricsCollector:
+    """Tests pour MetricsCollector."""
+
+    def test_operations_feed_histogram(self):
+        """Test de l'alimentation de l'histogramme par les opérations."""
+        collector = MetricsCollector("test")
+        metric = collector.start_operation("op")
+        collector.end_operation(metric, success=True)
+
+        metrics = collector.get_metrics()
+
+        assert metrics.histogram.total == 1
+        assert metrics.successful_operations == 1
+
+    def test_measure_success(self):
+        """Test de la mesure d'une opération réussie."""
+        collector = MetricsCollector("test")
+
+        with collector.measure("op"):
+            pass
+
+        metrics = collector.get_metrics()
+        assert metrics.total_operations == 1
+        assert metrics.successful_operations == 1
+        assert metrics.histogram.total == 1
+        assert len(metrics.operations) == 0
+
+    def test_measure_failure(self):
+        """Test de la mesure d'une opération en échec."""
+        collector = MetricsCollector("test")
+
+        with pytest.raises(RuntimeError):
+            with collector.measure("op"):
+                raise RuntimeError("boom")
+
+        with collector.measure("flagged") as outcome:
+            outcome[0] = False
+            outcome[1] = "not found"
+
+        metrics = collector.get_metrics()
+        assert metrics.failed_operations == 2
+        assert [op.error_message for op in metrics.operations] == ["boom", "not found"]
+
+    def test_measure_interrupt_is_a_failure(self):
+        """Test d'une interruption (hors Exception) comptée comme un échec."""
+        collector = MetricsCollector("test")
+
+        with pytest.raises(KeyboardInterrupt):
+            with collector.measure("op"):
+                raise KeyboardInterrupt
+
+        metrics = collector.get_metrics()
+        assert metrics.successful_operations == 0
+        assert metrics.failed_operations == 1
+
+
+def test_metric_classes_use_slots():
+    """Test de l'absence de __dict__ sur les métriques."""
+    metric = OperationMetric("op", start_time=1.0, end_time=1.5)
+
+    assert metric.duration == 0.5
+    assert not hasattr(metric, "__dict__")
+    assert not hasattr(ConnectorMetrics("test"), "__dict__")
+
+
+def test_average_duration_ignores_unfinished_operations():
+    """Test de la durée moyenne incrémentale."""
+    metrics = ConnectorMetrics("test")
+    metrics.add_operation(OperationMetric("a", start_time=0.0, end_time=1.0))
+    metrics.add_operation(OperationMetric("b", start_time=0.0, end_time=3.0))
+    metrics.add_operation(OperationMetric("c", start_time=0.0))
+
+    assert metrics.completed_operations == 2
+    assert metrics.average_duration == 2.0
+
+
+def test_get_metrics_snapshot_is_isolated():
+    """Test de l'indépendance des instantanés successifs."""
+    collector = MetricsCollector("test")
+    collector.end_operation(collector.start_operation("a"), success=False)
+    first = collector.get_metrics()
+
+    collector.end_operation(collector.start_operation("b"), success=False)
+    second = collector.get_metrics()
+
+    assert [op.operation_name for op in first.operations] == ["a"]
+    assert [op.operation_name for op in second.operations] == ["a", "b"]
+    with pytest.deprecated_call():
+        assert len(collector.metrics.operations) == 2
+
+
+def test_operations_support_indexing():
+    """Test de l'accès par index et par tranche au journal d'opérations."""
+    collector = MetricsCollector("test")
+    for name in ("a", "b", "c"):
+        collector.end_operation(collector.start_operation(name), success=False)
+        collector.get_metrics()  # Un segment figé par opération
+
+    operations = collector.get_metrics().operations
+    assert operations[0].operation_name == "a"
+    assert operations[-1].operation_name == "c"
+    assert [op.operation_name for op in operations[1:]] == ["b", "c"]
+    with pytest.raises(IndexError):
+        operations[3]
+
+
+def test_metrics_are_aggregated_across_threads():
+    """Test de l'agrégation des shards de plusieurs threads."""
+    collector = MetricsCollector("test")
+
+    def worker():
+        for _ in range(100):
+            with collector.measure("op"):
+                pass
+        collector.increment_connection_count()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = collector.get_metrics()
+    assert metrics.successful_operations == 400
+    assert metrics.histogram.total == 400
+    assert metrics.connection_count == 4
+
+    collector.reset_metrics()
+    assert collector.get_metrics().total_operations == 0
+
+
+def test_finished_thread_shards_are_retired():
+    """Test de la fusion puis du retrait des shards des threads terminés."""
+    collector = MetricsCollector("test")
+
+    def worker():
+        with collector.measure("op"):
+            pass
+        collector.increment_connection_count()
+
+    for _ in range(10):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    metrics = collector.get_metrics()
+    assert metrics.successful_operations == 10
+    assert metrics.connection_count == 10
+    assert collector._shards == []
+
+
+def test_pending_operations_are_flushed_on_read():
+    """Test de la fusion des opérations en attente lors de la lecture."""
+    collector = MetricsCollector("test")
+    collector.FLUSH_INTERVAL_NS = 10 ** 12
+
+    for name in ("a", "b", "c"):
+        collector.end_operation(collector.start_operation(name), success=False)
+
+    # Seule la première opération a déclenché une fusion immédiate
+    assert len(collector._operations) == 1
+    names = [op.operation_name for op in collector.get_metrics().operations]
+    assert names == ["a", "b", "c"]
@@ -0,0 +1,76 @@
+"""
+Tests pour les utilitaires de retry.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from connectors.exceptions import RetryExhaustedError
+from connectors.utils.retry import retry_on_exception, RetryManager
+
+
+class TestRetryOnException:
+    """Tests pour retry_on_exception."""
+
+    @patch('connectors.utils.retry.time.sleep')
+    def test_backoff_schedule(self, mock_sleep):
+        """Test du backoff exponentiel plafonné."""
+        func = Mock(side_effect=ValueError("boom"), __name__="func")
+        decorated = retry_on_exception(
+            max_attempts=4, backoff_factor=2.0, initial_delay=1.0, max_delay=3.0, jitter=False
+        )(func)
+
+        with pytest.raises(RetryExhaustedError):
+            decorated()
+
+        assert func.call_count == 4
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+    @patch('connectors.utils.retry.time.sleep')
+    def test_success_after_retry(self, mock_sleep):
+        """Test d'un succès après un échec."""
+        func = Mock(side_effect=[ValueError("boom"), "ok"], __name__="func")
+        decorated = retry_on_exception(max_attempts=3, initial_delay=0.5)(func)
+
+        assert decorated() == "ok"
+        assert mock_sleep.call_count == 1
+        assert 0.5 <= mock_sleep.call_args.args[0] <= 0.55
+
+
+class TestRetryManager:
+    """Tests pour RetryManager."""
+
+    @patch('connectors.utils.retry.time.sleep')
+    def test_accepts_unhashable_callable(self, mock_sleep):
+        """Test d'un callable non hashable (__eq__ sans __hash__)."""
+        class Flaky:
+            __eq__ = object.__eq__
+            __hash__ = None
+
+            def __init__(self):
+                self.calls = 0
+
+            def __call__(self, value):
+                self.calls += 1
+                if self.calls == 1:
+                    raise ValueError("boom")
+                return value * 2
+
+        manager = RetryManager(max_attempts=2, initial_delay=0.5)
+
+        assert manager.execute_with_retry(Flaky(), 2) == 4
+        assert mock_sleep.call_count == 1
+
+    @patch('connectors.utils.retry.time.sleep')
+    def test_uses_current_settings(self, mock_sleep):
+        """Test de la prise en compte des attributs modifiés après création."""
+        manager = RetryManager(max_attempts=2, initial_delay=1.0)
+        manager.max_attempts = 3
+        manager.initial_delay = 0.5
+        func = Mock(side_effect=ValueError("boom"), __name__="func")
+
+        with pytest.raises(RetryExhaustedError):
+            manager.execute_with_retry(func)
+
+        assert func.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert 0.5 <= mock_sleep.call_args_list[0].args[0] <= 0.55